@@ -1,5 +1,5 @@
 from flask import Blueprint, jsonify, request, session, current_app
-from app.services.case_analyzer import CaseAnalyzer
+from app.services.case_analyzer import CaseAnalyzer, dumps_json, loads_json, utc_timestamp
 from app.services.form_prefill import FormPrefillerService
 from app.services.database_service import DatabaseService
 import json
@@ -8,7 +8,6 @@ import re
 import uuid
 import traceback
 import openai
-from datetime import datetime
 import time
 from functools import wraps
 
@@ -85,14 +84,12 @@ def analyze_case():
         analysis = analyzer.initial_analysis(data['case_text'])
         
         try:
-            analysis_data = json.loads(analysis.get('analysis', '{}'))
+            analysis_data = analysis.get('analysis', {})
             analysis_data['gibberish_detected'] = False
             
             if unique_word_ratio > 0.99 and len(words) > 50:
                 analysis_data['gibberish_detected'] = True
             
-            analysis['analysis'] = json.dumps(analysis_data)
-            
             confidence = analysis_data.get('confidence')
             confidence_too_low = (
                 confidence == 'low' or 
@@ -108,6 +105,9 @@ def analyze_case():
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             current_app.logger.warning(f"Error processing analysis confidence: {e}")
         
+        if isinstance(analysis.get('analysis'), dict):
+            analysis['analysis'] = dumps_json(analysis['analysis'])
+        
         session['initial_analysis'] = analysis
         return jsonify(analysis), 200
 
@@ -202,7 +202,7 @@ def generate_summary():
             try:
                 # First, try to parse it directly as JSON
                 if isinstance(summary_text, str):
-                    summary_data = json.loads(summary_text)
+                    summary_data = loads_json(summary_text)
                     current_app.logger.info("Successfully parsed summary JSON")
                 else:
                     summary_data = summary_text
@@ -254,7 +254,7 @@ def generate_summary():
 
                     try:
 
-                        summary_data = json.loads(json_text)
+                        summary_data = loads_json(json_text)
                         current_app.logger.info("Successfully parsed summary JSON block")
 
 
@@ -407,7 +407,7 @@ def generate_questionnaire_summary():
         # FIXED: Create summary_result in EXACT same format as AI method
         summary_result = {
             "status": result.get("status", "success"),
-            "timestamp": result.get("timestamp", datetime.utcnow().isoformat()),
+            "timestamp": result.get("timestamp") or utc_timestamp(),
             "summary": result.get("summary", ""),
             "confidence_score": result.get("confidence_score", 85),
             "confidence_label": result.get("confidence_label", "High")
@@ -424,7 +424,7 @@ def generate_questionnaire_summary():
             try:
                 # First, try to parse it directly as JSON (SAME as AI method)
                 if isinstance(summary_text, str):
-                    summary_data = json.loads(summary_text)
+                    summary_data = loads_json(summary_text)
                     current_app.logger.info("Successfully parsed summary JSON")
                 else:
                     summary_data = summary_text
@@ -475,7 +475,7 @@ def generate_questionnaire_summary():
                     
                     try:
                         # Try to parse the JSON block
-                        summary_data = json.loads(json_text)
+                        summary_data = loads_json(json_text)
                         current_app.logger.info("Successfully parsed summary JSON block")
                         
                         # Extract title and summary as before (SAME as AI method)
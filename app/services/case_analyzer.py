@@ -1,15 +1,29 @@
+import copy
 import json
+import os
+import asyncio
+import httpx
 import openai
 from typing import Dict, Any, List, Tuple, Optional
-from datetime import datetime
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timezone
 import hashlib
-from dataclasses import dataclass, asdict
+import difflib
+from dataclasses import dataclass, asdict, is_dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import mul
 from enum import Enum
-import concurrent.futures
-from abc import ABC, abstractmethod
+from types import MappingProxyType
 import threading
 import time
 import re
+import weakref
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.utils.pii_remover import PIIRemover
 from legal_specialist_config import (
@@ -24,6 +38,7 @@ from legal_specialist_config import (
 class AgentRole(Enum):
     SPECIALIST = "specialist"
     COORDINATOR = "coordinator"
+    TRIAGE = "triage"
 
 def get_confidence_label(score: int) -> str:
     if score >= 75:
@@ -99,7 +114,418 @@ def print_overall_metrics_summary(analysis_result: 'CaseAnalysisResult', process
     print(f"         ANALYSIS COMPLETE")
     print(f"=" * 50)
 
-@dataclass
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with offset."""
+    return datetime.now(timezone.utc).isoformat()
+
+def text_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8', errors='replace'), digest_size=16).digest()
+
+_case_digest = lru_cache(maxsize=256)(text_digest)
+
+def prompt_cache_routing(static_prefix: str) -> Dict[str, str]:
+    """``extra_body`` routing requests that share ``static_prefix`` to the same
+    prompt-cache shard; the key changes whenever the prefix does."""
+    return {"prompt_cache_key": text_digest(static_prefix).hex()}
+
+def stable_seed(text: str, tag: str) -> int:
+    """Request seed in [0, 1000000) for ``text`` and ``tag``.
+
+    Unlike ``hash()`` it is the same in every process, and each case text is
+    digested once however many agents seed requests from it.
+    """
+    digest = hashlib.blake2b(_case_digest(text) + tag.encode('utf-8', errors='replace'), digest_size=4).digest()
+    return int.from_bytes(digest, 'little') % 1000000
+
+def loads_json(data):
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_default(value):
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps_json(data) -> str:
+    """Serialize to a JSON str, with orjson when it is installed.
+
+    Dataclasses serialize as dicts, enums as their values, datetimes as ISO
+    8601 and sets as lists; any other unknown type raises TypeError.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default).decode()
+    return json.dumps(data, ensure_ascii=False, default=_json_default)
+
+class LRUCache:
+    """Thread-safe bounded LRU mapping shared across analyzer instances."""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+class SemanticCache:
+    """Thread-safe bounded store of (unit vector, value) pairs, looked up by
+    cosine similarity to find values cached for near-duplicate inputs."""
+
+    def __init__(self, maxsize: int = 512):
+        self._entries = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, namespace, vector: List[float], threshold: float):
+        """Value of the most similar entry in ``namespace``, if its similarity
+        to ``vector`` is at least ``threshold``."""
+        with self._lock:
+            entries = list(self._entries)
+        best_similarity, best_value = threshold, None
+        for entry_namespace, entry_vector, value in entries:
+            if entry_namespace != namespace:
+                continue
+            similarity = sum(map(mul, entry_vector, vector))
+            if similarity >= best_similarity:
+                best_similarity, best_value = similarity, value
+        return best_value
+
+    def set(self, namespace, vector: List[float], value) -> None:
+        with self._lock:
+            self._entries.append((namespace, vector, value))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_TITLE_CACHE = LRUCache(maxsize=2048)
+_ANALYSIS_CACHE = LRUCache(maxsize=10000)
+_PII_CACHE = LRUCache(maxsize=1024)
+_EMBEDDING_CACHE = LRUCache(maxsize=16)
+_SEMANTIC_CACHE = SemanticCache(maxsize=512)
+_RESPONSE_CACHE = LRUCache(maxsize=10000)
+
+# Request fields that do not change the model's reply
+_RESPONSE_CACHE_IGNORED_FIELDS = frozenset(("seed", "extra_body"))
+
+def response_cache_key(request: Dict[str, Any]) -> Tuple[str, bytes]:
+    """Content address of a chat request: its model and a digest of every field
+    that shapes the reply, so any prompt, schema or sampling change is a new key
+    without a version to bump."""
+    payload = {key: value for key, value in request.items() if key not in _RESPONSE_CACHE_IGNORED_FIELDS}
+    return request["model"], text_digest(dumps_json(payload))
+
+class RateLimiter:
+    """Token bucket over requests and tokens per minute. ``reserve`` books capacity
+    for one call and returns how long the caller must wait before sending it, so
+    bursts are paced client-side instead of being answered with 429s."""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60) - 1
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60) - tokens
+            return max(0.0, -self._requests * 60 / self.rpm, -self._tokens * 60 / self.tpm)
+
+_RATE_LIMITER: Optional[RateLimiter] = None
+
+def configure_rate_limit(rpm: int, tpm: int) -> None:
+    """Enable client-side pacing of model calls; a limit of 0 disables it."""
+    global _RATE_LIMITER
+    _RATE_LIMITER = RateLimiter(rpm, tpm) if rpm > 0 and tpm > 0 else None
+
+configure_rate_limit(int(os.getenv("OPENAI_RPM_LIMIT", "0")), int(os.getenv("OPENAI_TPM_LIMIT", "0")))
+_RATE_LIMITED_PATHS = ("/chat/completions", "/embeddings")
+
+def _request_cost(request: httpx.Request) -> Optional[int]:
+    """Estimated tokens for a model call (prompt bytes / 4 plus the completion
+    cap), or None for requests the limits do not apply to."""
+    if not request.url.path.endswith(_RATE_LIMITED_PATHS):
+        return None
+    body = request.content
+    try:
+        max_tokens = loads_json(body).get("max_tokens") or 0
+    except ValueError:
+        max_tokens = 0
+    return len(body) // 4 + max_tokens
+
+def _pace_request(request: httpx.Request) -> None:
+    limiter = _RATE_LIMITER
+    cost = _request_cost(request) if limiter else None
+    if cost is not None:
+        wait = limiter.reserve(cost)
+        if wait:
+            time.sleep(wait)
+
+async def _apace_request(request: httpx.Request) -> None:
+    limiter = _RATE_LIMITER
+    cost = _request_cost(request) if limiter else None
+    if cost is not None:
+        wait = limiter.reserve(cost)
+        if wait:
+            await asyncio.sleep(wait)
+
+_CLIENT_CACHE: Dict[str, openai.OpenAI] = {}
+_CLIENT_LOCK = threading.Lock()
+_CLIENT_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=200)
+_CLIENT_TIMEOUT = httpx.Timeout(60.0)
+# The SDK retries 429s and 5xx with jittered exponential backoff, honouring Retry-After
+_CLIENT_MAX_RETRIES = 4
+
+def get_openai_client(api_key: str) -> openai.OpenAI:
+    """Process-wide OpenAI client for ``api_key``, so analyzers created per
+    request reuse one keep-alive connection pool."""
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(api_key)
+            if client is None:
+                client = openai.OpenAI(
+                    api_key=api_key,
+                    timeout=_CLIENT_TIMEOUT,
+                    max_retries=_CLIENT_MAX_RETRIES,
+                    http_client=openai.DefaultHttpxClient(
+                        limits=_CLIENT_LIMITS,
+                        event_hooks={"request": [_pace_request]}
+                    )
+                )
+                _CLIENT_CACHE[api_key] = client
+    return client
+
+_ASYNC_CLIENT_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, openai.AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def get_async_openai_client(api_key: str) -> openai.AsyncOpenAI:
+    """AsyncOpenAI client for ``api_key`` on the running event loop. An async
+    connection pool cannot be shared across loops, so clients are cached per loop."""
+    clients = _ASYNC_CLIENT_CACHE.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            timeout=_CLIENT_TIMEOUT,
+            max_retries=_CLIENT_MAX_RETRIES,
+            http_client=openai.DefaultAsyncHttpxClient(
+                limits=_CLIENT_LIMITS,
+                event_hooks={"request": [_apace_request]}
+            )
+        )
+        clients[api_key] = client
+    return client
+
+async def close_async_openai_clients() -> None:
+    """Close the clients cached for the running loop before it shuts down."""
+    for client in _ASYNC_CLIENT_CACHE.pop(asyncio.get_running_loop(), {}).values():
+        await client.close()
+
+async def run_closing_async_clients(coro):
+    """Await ``coro`` then close this loop's cached clients; for ``asyncio.run``."""
+    try:
+        return await coro
+    finally:
+        await close_async_openai_clients()
+
+_SPAM_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(.)\1{10,}',
+    r'[!]{5,}',
+    r'[?]{5,}',
+    r'[A-Z]{20,}',
+))
+
+_NON_SPACE_RUN_RE = re.compile(r"\S+")
+
+_REASONING_KEYWORDS = (
+    "statute", "law", "legal", "court", "jurisdiction", "precedent", "regulation", "rights", "obligation", "procedure"
+)
+
+_DETAIL_INDICATORS = ('date', 'time', 'amount', 'contract', 'agreement', 'document', 'evidence', 'witness')
+
+_SPECIALIZED_TERMS = (
+    'adoption', 'custody', 'divorce', 'paternity', 'guardianship', 'alimony',
+    'employment', 'discrimination', 'harassment', 'wrongful termination', 'wages',
+    'criminal', 'felony', 'misdemeanor', 'plea', 'sentencing', 'probation',
+    'contract', 'breach', 'damages', 'liability', 'negligence', 'tort',
+    'property', 'real estate', 'mortgage', 'foreclosure', 'title', 'deed',
+    'immigration', 'visa', 'citizenship', 'deportation', 'asylum',
+    'bankruptcy', 'debt', 'creditor', 'discharge', 'liquidation',
+    'malpractice', 'standard of care', 'expert witness', 'causation',
+    'intellectual property', 'copyright', 'trademark', 'patent', 'infringement'
+)
+
+_CONFIDENCE_LEVEL_POINTS = {"high": 4, "medium": 2}
+
+_CONTEXT_WORDS = ('because', 'since', 'after', 'before', 'when', 'where', 'how', 'why')
+
+_FALLBACK_LEGAL_TERMS = ('law', 'legal', 'court', 'statute', 'regulation', 'procedure', 'jurisdiction', 'precedent')
+
+_CATEGORY_INDICATORS = {
+    'Family Law': ('family', 'child', 'parent', 'marriage', 'divorce', 'custody', 'adoption'),
+    'Employment Law': ('job', 'work', 'employer', 'employee', 'fired', 'discrimination', 'wage'),
+    'Criminal Law': ('criminal', 'arrest', 'charge', 'court', 'police', 'guilty', 'crime'),
+    'Real Estate Law': ('property', 'house', 'real estate', 'mortgage', 'deed', 'title'),
+    'Business/Corporate Law': ('business', 'company', 'contract', 'agreement', 'corporate'),
+    'Personal Injury Law': ('injury', 'accident', 'hurt', 'medical', 'hospital', 'doctor'),
+    'Immigration Law': ('immigration', 'visa', 'citizen', 'deport', 'green card')
+}
+
+_COMPLEXITY_INDICATORS = (
+    'contract', 'agreement', 'court', 'lawsuit', 'legal', 'attorney',
+    'damages', 'liability', 'breach', 'violation', 'statute', 'regulation'
+)
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+_LEGAL_INDICATORS = frozenset({
+    'medical', 'surgery', 'device', 'business', 'partner', 'customer',
+    'company', 'contract', 'employer', 'fired', 'accident', 'injury',
+    'property', 'defective', 'product', 'divorce', 'custody', 'arrested',
+    'lawyer', 'attorney', 'court', 'lawsuit', 'doctor', 'hospital',
+    'legal', 'law', 'rights', 'claim', 'damages', 'violation'
+})
+# Indicators also count inside longer words ("divorced", "lawyers")
+_LEGAL_INDICATOR_RE = re.compile("|".join(sorted(_LEGAL_INDICATORS)))
+
+_IS_RELEVANT_RE = re.compile(r'"is_relevant"\s*:\s*(true|false)')
+# The field leads the response; stop looking for it after this many characters
+_IS_RELEVANT_SCAN_LIMIT = 256
+_NOT_RELEVANT_CONTENT = '{"is_relevant": false}'
+
+def _irrelevance_verdict(head: str) -> Optional[bool]:
+    """True once ``head`` declares ``"is_relevant": false``, False once it is
+    clear it will not, None while undecided."""
+    match = _IS_RELEVANT_RE.search(head)
+    if match:
+        return match.group(1) == "false"
+    if len(head) > _IS_RELEVANT_SCAN_LIMIT:
+        return False
+    return None
+
+def collect_stream(stream, cancel_event: threading.Event = None,
+                   stop_if_irrelevant: bool = False) -> Optional[str]:
+    """Accumulate the text deltas of a streamed chat completion.
+
+    If ``cancel_event`` is set while chunks are still arriving, the stream is
+    closed and ``None`` is returned. With ``stop_if_irrelevant`` the stream is
+    also closed as soon as the JSON declares ``"is_relevant": false``, and
+    ``_NOT_RELEVANT_CONTENT`` stands in for the rest of the response.
+    """
+    chunks = []
+    head = "" if stop_if_irrelevant else None
+    for event in stream:
+        if cancel_event is not None and cancel_event.is_set():
+            stream.close()
+            return None
+        if event.choices:
+            delta = event.choices[0].delta.content or ""
+            chunks.append(delta)
+            if head is not None:
+                head += delta
+                verdict = _irrelevance_verdict(head)
+                if verdict:
+                    stream.close()
+                    return _NOT_RELEVANT_CONTENT
+                if verdict is not None:
+                    head = None
+    return "".join(chunks)
+
+async def acollect_stream(stream, cancel_event: threading.Event = None,
+                          stop_if_irrelevant: bool = False) -> Optional[str]:
+    """Async counterpart of ``collect_stream``."""
+    chunks = []
+    head = "" if stop_if_irrelevant else None
+    async for event in stream:
+        if cancel_event is not None and cancel_event.is_set():
+            await stream.close()
+            return None
+        if event.choices:
+            delta = event.choices[0].delta.content or ""
+            chunks.append(delta)
+            if head is not None:
+                head += delta
+                verdict = _irrelevance_verdict(head)
+                if verdict:
+                    await stream.close()
+                    return _NOT_RELEVANT_CONTENT
+                if verdict is not None:
+                    head = None
+    return "".join(chunks)
+
+SPECIALIST_CONCURRENCY = 16
+
+async def gather_specialists(agents: List['BaseAgent'], case_text: str,
+                             context: Dict[str, Any] = None) -> List[Tuple['BaseAgent', Any]]:
+    """Run every agent's ``aprocess`` on ``case_text`` concurrently.
+
+    At most ``SPECIALIST_CONCURRENCY`` agents run at once. Returns
+    ``(agent, outcome)`` pairs in agent order, where ``outcome`` is the
+    agent's result or the exception it raised. Once an agent sets
+    ``context["cancel_event"]`` the agents still running are cancelled and
+    their outcome is ``asyncio.CancelledError``.
+    """
+    semaphore = asyncio.Semaphore(SPECIALIST_CONCURRENCY)
+    cancel_event = (context or {}).get("cancel_event")
+    
+    async def bounded(agent: 'BaseAgent') -> Any:
+        async with semaphore:
+            return await agent.aprocess(case_text, context)
+    
+    tasks = {asyncio.create_task(bounded(agent)): agent for agent in agents}
+    outcomes = {}
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            outcomes[tasks[task]] = task.exception() or task.result()
+        if pending and cancel_event is not None and cancel_event.is_set():
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+            for task in pending:
+                outcomes[tasks[task]] = asyncio.CancelledError()
+            break
+    
+    return [(agent, outcomes[agent]) for agent in agents]
+
+@dataclass(slots=True, frozen=True)
 class LegalClassification:
     category: str
     subcategory: str
@@ -118,8 +544,24 @@ class LegalClassification:
     @property
     def confidence_label(self) -> str:
         return get_confidence_label(self.confidence_score)
+    
+    def as_secondary_issue(self) -> Dict[str, Any]:
+        label = get_confidence_label(self.confidence_score)
+        return {
+            "category": self.category,
+            "subcategory": self.subcategory,
+            "confidence": label,
+            "confidence_score": self.confidence_score,
+            "confidence_label": label,
+            "relevance_score": self.relevance_score,
+            "urgency_score": self.urgency_score,
+            "reasoning": self.reasoning,
+            "fallback_used": self.fallback_used,
+            "consistency_hash": self.consistency_hash,
+            "validation_score": self.validation_score
+        }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CaseAnalysisResult:
     primary_classification: LegalClassification
     secondary_classifications: List[LegalClassification]
@@ -132,6 +574,76 @@ class CaseAnalysisResult:
     validation_passed: bool = True
     accuracy_score: float = 0.0
 
+@dataclass(slots=True, frozen=True)
+class CaseFeatures:
+    """Case-only inputs to specialist scoring, computed once per request and
+    shared by every agent instead of each one re-scanning the text."""
+    case_lower: str
+    tokens: frozenset
+    complexity_score: int
+    terminology_score: int
+    content_factors: Tuple[int, ...]
+    authenticity_modifier: float
+    
+    @classmethod
+    def from_text(cls, case_text: str) -> 'CaseFeatures':
+        case_lower = case_text.lower()
+        words = case_text.split()
+        case_words = len(words)
+        sentences_in_case = len([s for s in case_text.split('.') if len(s.strip()) > 5])
+        
+        complexity_score = 0
+        
+        if case_words > 200:
+            complexity_score += 10
+        elif case_words > 150:
+            complexity_score += 8
+        elif case_words > 100:
+            complexity_score += 6
+        elif case_words > 60:
+            complexity_score += 4
+        elif case_words > 30:
+            complexity_score += 2
+        
+        avg_sentence_length = case_words / max(sentences_in_case, 1)
+        if avg_sentence_length > 15:
+            complexity_score += 5
+        elif avg_sentence_length > 12:
+            complexity_score += 3
+        elif avg_sentence_length > 8:
+            complexity_score += 2
+        
+        detail_count = sum(1 for indicator in _DETAIL_INDICATORS if indicator in case_lower)
+        complexity_score += min(5, detail_count)
+        
+        terms_found = sum(1 for term in _SPECIALIZED_TERMS if term in case_lower)
+        terminology_score = min(15, int(terms_found * 1.8))
+        
+        case_hash = hashlib.md5(case_text.encode()).hexdigest()
+        content_factors = tuple(int(case_hash[i:i+8], 16) % 100 for i in range(0, len(case_hash), 8))
+        
+        word_diversity = len(set(case_lower.split())) / max(case_words, 1)
+        char_distribution = len(set(case_lower)) / max(len(case_text), 1)
+        
+        authenticity_modifier = (word_diversity * 5) + (char_distribution * 10)
+        authenticity_modifier = min(8, max(-3, authenticity_modifier - 7))
+        
+        return cls(
+            case_lower=case_lower,
+            tokens=frozenset(_WORD_RE.findall(case_lower)),
+            complexity_score=complexity_score,
+            terminology_score=terminology_score,
+            content_factors=content_factors,
+            authenticity_modifier=authenticity_modifier
+        )
+
+# Substring matches, as before: "rights" and "lawful" count
+_ACCURACY_KEYWORD_RE = re.compile("statute|law|legal|right|obligation", re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _legal_area_re(legal_area: str) -> re.Pattern:
+    return re.compile(re.escape(legal_area), re.IGNORECASE)
+
 class AccuracyValidator:
     @staticmethod
     def validate_classification_accuracy(classification: Dict[str, Any], case_text: str, legal_area: str) -> float:
@@ -140,9 +652,9 @@ class AccuracyValidator:
         reasoning = classification.get("legal_reasoning", "")
         if len(reasoning) > 50:
             accuracy_score += 0.2
-        if any(keyword in reasoning.lower() for keyword in ["statute", "law", "legal", "right", "obligation"]):
+        if _ACCURACY_KEYWORD_RE.search(reasoning):
             accuracy_score += 0.1
-        if legal_area.lower() in reasoning.lower():
+        if _legal_area_re(legal_area).search(reasoning):
             accuracy_score += 0.1
         
         legal_relationships = classification.get("legal_relationships", [])
@@ -165,7 +677,8 @@ class AccuracyValidator:
         elif confidence == "medium" and urgency > 0.4:
             accuracy_score += 0.1
         
-        if classification.get("competency_match") and len(classification.get("competency_match", "")) > 20:
+        competency_match = classification.get("competency_match")
+        if competency_match and len(competency_match) > 20:
             accuracy_score += 0.1
         
         return min(1.0, accuracy_score)
@@ -174,7 +687,7 @@ class ConsistencyValidator:
     @staticmethod
     def generate_consistency_hash(case_text: str, classification: Dict[str, Any]) -> str:
         key_elements = f"{case_text[:100]}|{classification.get('category')}|{classification.get('subcategory')}"
-        return hashlib.md5(key_elements.encode()).hexdigest()[:8]
+        return hashlib.blake2b(key_elements.encode('utf-8'), digest_size=4).hexdigest()
     
     @staticmethod
     def validate_classification_consistency(classifications: List[LegalClassification], 
@@ -182,10 +695,7 @@ class ConsistencyValidator:
         if len(classifications) < 2:
             return True, 1.0
         
-        category_counts = {}
-        for c in classifications:
-            key = f"{c.category}|{c.subcategory}"
-            category_counts[key] = category_counts.get(key, 0) + 1
+        category_counts = Counter((c.category, c.subcategory) for c in classifications)
         
         max_count = max(category_counts.values())
         consistency_score = max_count / len(classifications)
@@ -201,28 +711,23 @@ class InputGuardrails:
             "severity": "none"
         }
         
+        # strip() returns the same object when there is nothing to strip
         if len(case_text.strip()) < 10:
             validation_result["is_valid"] = False
             validation_result["issues"].append("Case description too short")
             validation_result["severity"] = "error"
             return validation_result
         
-        word_count = len(case_text.split())
+        # Stop after three words instead of splitting the whole text
+        word_count = sum(1 for _ in islice(_NON_SPACE_RUN_RE.finditer(case_text), 3))
         if word_count < 3:
             validation_result["is_valid"] = False
             validation_result["issues"].append("Insufficient detail provided")
             validation_result["severity"] = "error"
             return validation_result
         
-        spam_indicators = [
-            r'(.)\1{10,}',
-            r'[!]{5,}',
-            r'[?]{5,}',
-            r'[A-Z]{20,}',
-        ]
-        
-        for pattern in spam_indicators:
-            if re.search(pattern, case_text):
+        for pattern in _SPAM_PATTERNS:
+            if pattern.search(case_text):
                 validation_result["issues"].append("Potential spam content detected")
                 validation_result["severity"] = "warning"
                 break
@@ -259,17 +764,47 @@ class OutputGuardrails:
         
         return validation_result
 
-class BaseAgent(ABC):
+def format_subcategories(legal_categories: Dict[str, List[str]]) -> str:
+    formatted = []
+    for category, subcategories in legal_categories.items():
+        subcats = ", ".join(subcategories)
+        formatted.append(f"**{category}**: {subcats}")
+    return "\n".join(formatted)
+
+# Specialist analysis fields shared by the per-agent and batched response schemas
+_ANALYSIS_DETAIL_PROPERTIES = MappingProxyType({
+    "confidence_level": {"type": "string", "enum": ["high", "medium", "low"]},
+    "legal_reasoning": {"type": "string"},
+    "legal_relationships": {"type": "array", "items": {"type": "string"}},
+    "applicable_law": {"type": "array", "items": {"type": "string"}},
+    "legal_remedies": {"type": "array", "items": {"type": "string"}},
+    "urgency_assessment": {"type": "number"},
+    "complexity_assessment": {"type": "number"},
+    "competency_match": {"type": "string"},
+    "secondary_areas": {"type": "array", "items": {"type": "string"}},
+    "keywords_detected": {"type": "array", "items": {"type": "string"}}
+})
+
+class BaseAgent:
     def __init__(self, agent_id: str, client: openai.OpenAI):
         self.agent_id = agent_id
         self.client = client
         self.role = AgentRole.SPECIALIST
         
-    @abstractmethod
     def process(self, case_text: str, context: Dict[str, Any] = None) -> Any:
-        pass
+        """Analyze ``case_text``, which the analyzer has already PII-scrubbed
+        once for the whole case; agents must not scrub it again."""
+        raise NotImplementedError
+    
+    async def aprocess(self, case_text: str, context: Dict[str, Any] = None) -> Any:
+        return await asyncio.to_thread(self.process, case_text, context)
 
 class EnhancedLegalSpecialistAgent(BaseAgent):
+    # Start the fallback analysis alongside the enhanced one in ``aprocess``,
+    # trading an extra request per specialist for lower latency when the
+    # enhanced result misses the accuracy threshold
+    SPECULATIVE_FALLBACK = False
+    
     def __init__(self, agent_id: str, client: openai.OpenAI, legal_area: str, 
                  keywords: List[str], subcategories: List[str], case_descriptions: List[str], 
                  legal_concepts: List[str], legal_categories: Dict[str, List[str]]):
@@ -277,6 +812,8 @@ class EnhancedLegalSpecialistAgent(BaseAgent):
         self.legal_area = legal_area
         self.keywords = keywords
         self.subcategories = subcategories
+        self.subcategory_set = frozenset(subcategories)
+        self.valid_categories = {legal_area: self.subcategory_set}
         self.case_descriptions = case_descriptions
         self.legal_concepts = legal_concepts
         self.LEGAL_CATEGORIES = legal_categories
@@ -285,18 +822,34 @@ class EnhancedLegalSpecialistAgent(BaseAgent):
         self.consistency_threshold = 0.8
         self.accuracy_threshold = 0.6
         self.last_confidence_score = None
+        self._legal_area_definition = get_legal_area_definition(legal_area)
+        self._system_prompt, self._analysis_prefix = self._build_enhanced_prompts()
+        self._response_format = self._build_response_format()
+        self._enhanced_extra_body = prompt_cache_routing(self._system_prompt + self._analysis_prefix)
+        self._batch_brief = (
+            f"{legal_area.upper()}\n"
+            f"Definition: {self._legal_area_definition}\n"
+            f"Valid subcategories: {', '.join(subcategories)}\n"
+            f"Related keywords: {', '.join(keywords[:25])}"
+        )
+        self._fallback_system_message = {
+            "role": "system",
+            "content": f"You are conducting final accuracy-focused analysis for {legal_area}."
+        }
+        self._fallback_instructions_message = {"role": "user", "content": self._build_fallback_instructions()}
+        self._fallback_extra_body = prompt_cache_routing(
+            self._fallback_system_message["content"] + self._fallback_instructions_message["content"]
+        )
 
     def _calculate_dynamic_confidence(self, result: Dict[str, Any], accuracy_score: float, 
                                     relevance_score: float, complexity: float, urgency: float, 
-                                    case_text: str) -> int:
-        import hashlib
-        
+                                    case_text: str, features: CaseFeatures = None) -> int:
         reasoning = result.get("legal_reasoning", "")
         reasoning_score = 0
         
         reasoning_len = len(reasoning)
-        legal_keywords = ["statute", "law", "legal", "court", "jurisdiction", "precedent", "regulation", "rights", "obligation", "procedure"]
-        legal_keyword_count = sum(1 for word in legal_keywords if word in reasoning.lower())
+        reasoning_lower = reasoning.lower()
+        legal_keyword_count = sum(1 for word in _REASONING_KEYWORDS if word in reasoning_lower)
         
         if reasoning_len > 300:
             reasoning_score += 12
@@ -328,56 +881,10 @@ class EnhancedLegalSpecialistAgent(BaseAgent):
         structure_score += min(7, len(applicable_law) * 2)
         structure_score += min(5, len(legal_remedies) * 1.5)
         
-        case_words = len(case_text.split())
-        sentences_in_case = len([s for s in case_text.split('.') if len(s.strip()) > 5])
+        if features is None:
+            features = CaseFeatures.from_text(case_text)
         
-        complexity_score = 0
-        
-        if case_words > 200:
-            complexity_score += 10
-        elif case_words > 150:
-            complexity_score += 8
-        elif case_words > 100:
-            complexity_score += 6
-        elif case_words > 60:
-            complexity_score += 4
-        elif case_words > 30:
-            complexity_score += 2
-        
-        avg_sentence_length = case_words / max(sentences_in_case, 1)
-        if avg_sentence_length > 15:
-            complexity_score += 5
-        elif avg_sentence_length > 12:
-            complexity_score += 3
-        elif avg_sentence_length > 8:
-            complexity_score += 2
-        
-        detail_indicators = ['date', 'time', 'amount', 'contract', 'agreement', 'document', 'evidence', 'witness']
-        detail_count = sum(1 for indicator in detail_indicators if indicator in case_text.lower())
-        complexity_score += min(5, detail_count)
-        
-        specialized_terms = [
-            'adoption', 'custody', 'divorce', 'paternity', 'guardianship', 'alimony',
-            'employment', 'discrimination', 'harassment', 'wrongful termination', 'wages',
-            'criminal', 'felony', 'misdemeanor', 'plea', 'sentencing', 'probation',
-            'contract', 'breach', 'damages', 'liability', 'negligence', 'tort',
-            'property', 'real estate', 'mortgage', 'foreclosure', 'title', 'deed',
-            'immigration', 'visa', 'citizenship', 'deportation', 'asylum',
-            'bankruptcy', 'debt', 'creditor', 'discharge', 'liquidation',
-            'malpractice', 'standard of care', 'expert witness', 'causation',
-            'intellectual property', 'copyright', 'trademark', 'patent', 'infringement'
-        ]
-        
-        terms_found = sum(1 for term in specialized_terms if term in case_text.lower())
-        terminology_score = min(15, int(terms_found * 1.8))
-        
-        confidence_level = result.get("confidence_level", "low")
-        analytical_score = 0
-        
-        if confidence_level == "high":
-            analytical_score += 4
-        elif confidence_level == "medium":
-            analytical_score += 2
+        analytical_score = _CONFIDENCE_LEVEL_POINTS.get(result.get("confidence_level", "low"), 0)
         
         competency_match = result.get("competency_match", "")
         if len(competency_match) > 150:
@@ -398,30 +905,18 @@ class EnhancedLegalSpecialistAgent(BaseAgent):
         validation_score += int(relevance_score * 3)
         validation_score += int(complexity * 2)
         
-        case_hash = hashlib.md5(case_text.encode()).hexdigest()
-        content_factors = []
-        
-        for i in range(0, len(case_hash), 8):
-            hex_segment = case_hash[i:i+8]
-            content_factors.append(int(hex_segment, 16) % 100)
-        
-        word_diversity = len(set(case_text.lower().split())) / max(len(case_text.split()), 1)
-        char_distribution = len(set(case_text.lower())) / max(len(case_text), 1)
-        
-        authenticity_modifier = (word_diversity * 5) + (char_distribution * 10)
-        authenticity_modifier = min(8, max(-3, authenticity_modifier - 7))
-        
         base_composite = (
             reasoning_score +
             structure_score +
-            complexity_score +
-            terminology_score +
+            features.complexity_score +
+            features.terminology_score +
             analytical_score +
             validation_score
         )
         
+        content_factors = features.content_factors
         case_signature = sum(content_factors[:3]) % 21 - 10
-        natural_variation = case_signature + authenticity_modifier
+        natural_variation = case_signature + features.authenticity_modifier
         
         final_score = int(base_composite + natural_variation)
         
@@ -434,26 +929,33 @@ class EnhancedLegalSpecialistAgent(BaseAgent):
         
         if self.last_confidence_score is not None:
             if abs(final_score - self.last_confidence_score) < 2:
-                content_differentiation = (content_factors[4] % 9) - 4
+                content_differentiation = (content_factors[-1] % 9) - 4
                 final_score = max(20, min(96, final_score + content_differentiation))
         
         self.last_confidence_score = final_score
         return final_score
         
     def process(self, case_text: str, context: Dict[str, Any] = None) -> Optional[LegalClassification]:
-        start_time = time.time()
+        start_time = time.perf_counter()
+        features = (context or {}).get("case_features") or CaseFeatures.from_text(case_text)
+        cancel_event = (context or {}).get("cancel_event")
         
         try:
             validation = InputGuardrails.validate_case_input(case_text)
             if not validation["is_valid"]:
                 return None
             
-            best_result = self._perform_enhanced_accurate_analysis(case_text, start_time)
+            best_result = self._perform_enhanced_accurate_analysis(case_text, start_time, features, cancel_event)
             
             if best_result and best_result.validation_score >= self.accuracy_threshold:
+                if cancel_event is not None and best_result.confidence_label == "High":
+                    cancel_event.set()
+                return best_result
+            
+            if cancel_event is not None and cancel_event.is_set():
                 return best_result
             
-            fallback_result = self._perform_fallback_analysis(case_text, start_time)
+            fallback_result = self._perform_fallback_analysis(case_text, start_time, features)
             
             if best_result and fallback_result:
                 if best_result.validation_score >= fallback_result.validation_score:
@@ -464,30 +966,114 @@ class EnhancedLegalSpecialistAgent(BaseAgent):
             return best_result or fallback_result
                 
         except Exception as e:
-            return self._perform_fallback_analysis(case_text, start_time)
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            return self._perform_fallback_analysis(case_text, start_time, features)
     
-    def _perform_enhanced_accurate_analysis(self, case_text: str, start_time: float) -> Optional[LegalClassification]:
+    async def aprocess(self, case_text: str, context: Dict[str, Any] = None) -> Optional[LegalClassification]:
+        """Async ``process`` issuing the enhanced analysis through ``context["async_client"]``."""
+        async_client = (context or {}).get("async_client")
+        if async_client is None:
+            return await super().aprocess(case_text, context)
+        
+        start_time = time.perf_counter()
+        features = context.get("case_features") or CaseFeatures.from_text(case_text)
+        cancel_event = context.get("cancel_event")
+        fallback_task = None
+        
+        try:
+            validation = InputGuardrails.validate_case_input(case_text)
+            if not validation["is_valid"]:
+                return None
+            
+            if self.SPECULATIVE_FALLBACK:
+                fallback_task = asyncio.create_task(
+                    self._aperform_fallback_analysis(async_client, case_text, start_time, features)
+                )
+            
+            best_result = await self._aperform_enhanced_accurate_analysis(
+                async_client, case_text, start_time, features, cancel_event
+            )
+            
+            if best_result and best_result.validation_score >= self.accuracy_threshold:
+                if cancel_event is not None and best_result.confidence_label == "High":
+                    cancel_event.set()
+                return best_result
+            
+            if cancel_event is not None and cancel_event.is_set():
+                return best_result
+            
+            if fallback_task is not None:
+                fallback_result = await fallback_task
+            else:
+                fallback_result = await self._aperform_fallback_analysis(async_client, case_text, start_time, features)
+            
+            if best_result and fallback_result:
+                if best_result.validation_score >= fallback_result.validation_score:
+                    return best_result
+                else:
+                    return fallback_result
+            
+            return best_result or fallback_result
+                
+        except Exception as e:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if fallback_task is not None:
+                return await fallback_task
+            return await self._aperform_fallback_analysis(async_client, case_text, start_time, features)
+        finally:
+            if fallback_task is not None and not fallback_task.done():
+                fallback_task.cancel()
+    
+    async def _aperform_enhanced_accurate_analysis(self, async_client: openai.AsyncOpenAI, case_text: str,
+                                                   start_time: float, features: CaseFeatures = None,
+                                                   cancel_event: threading.Event = None) -> Optional[LegalClassification]:
+        request = self.enhanced_request(case_text)
+        cache_key = response_cache_key(request)
+        content = _RESPONSE_CACHE.get(cache_key)
+        if content is None:
+            stream = await async_client.chat.completions.create(stream=True, **request)
+            content = await acollect_stream(stream, cancel_event, stop_if_irrelevant=True)
+            if content is None:
+                return None
+        result = loads_json(content)
+        _RESPONSE_CACHE.set(cache_key, content)
+        return self.build_enhanced_classification(case_text, result, start_time, features)
+    
+    def _perform_enhanced_accurate_analysis(self, case_text: str, start_time: float, features: CaseFeatures = None,
+                                            cancel_event: threading.Event = None) -> Optional[LegalClassification]:
+        """Stream the enhanced analysis, abandoning it if ``cancel_event`` is set
+        because another specialist already returned a high-confidence match."""
+        request = self.enhanced_request(case_text)
+        cache_key = response_cache_key(request)
+        content = _RESPONSE_CACHE.get(cache_key)
+        if content is None:
+            stream = self.client.chat.completions.create(stream=True, **request)
+            content = collect_stream(stream, cancel_event, stop_if_irrelevant=True)
+            if content is None:
+                return None
+        result = loads_json(content)
+        _RESPONSE_CACHE.set(cache_key, content)
+        return self.build_enhanced_classification(case_text, result, start_time, features)
+    
+    def _build_enhanced_prompts(self) -> Tuple[str, str]:
+        """System prompt and case-independent analysis prompt for this legal area.
+
+        The case text is appended after the prefix so every request for the
+        area shares an identical, cacheable prompt prefix.
+        """
         legal_definitions = self._get_legal_area_definitions()
         case_examples = "\n".join([f"• {desc}" for desc in self.case_descriptions])
         
         keywords_context = ", ".join(self.keywords[:25])
         concepts_context = ", ".join(self.legal_concepts[:20])
         
-        system_prompt = f"""You are a senior {self.legal_area} attorney with 25+ years of experience and a 98% accuracy rate in legal classification.
-
-CRITICAL ACCURACY REQUIREMENTS:
-1. Base ALL decisions on substantive legal analysis, not superficial keyword matching
-2. Consider the COMPLETE legal context and all possible interpretations
-3. Apply the "reasonable attorney" standard - would a competent {self.legal_area} attorney handle this case?
-4. Err on the side of inclusion rather than exclusion for borderline cases
-5. Provide DETAILED legal reasoning that demonstrates deep analysis
-
-Your reputation depends on accuracy. Take time to analyze thoroughly before deciding."""
+        system_prompt = f"""You are a senior {self.legal_area} attorney classifying cases. Base every decision on substantive legal analysis rather than keyword matching, apply the "reasonable attorney" standard, and err on the side of inclusion for borderline cases."""
 
-        analysis_prompt = f"""COMPREHENSIVE LEGAL ANALYSIS - ACCURACY PRIORITY
-
-CASE FOR DETAILED ANALYSIS:
-"{case_text}"
+        numbered_subcategories = "\n".join(f"{i}. {sub}" for i, sub in enumerate(self.subcategories))
+        
+        analysis_prefix = f"""COMPREHENSIVE LEGAL ANALYSIS - ACCURACY PRIORITY
 
 {self.legal_area.upper()} LEGAL DOMAIN:
 
@@ -495,7 +1081,7 @@ DEFINITION & SCOPE:
 {legal_definitions}
 
 VALID SUBCATEGORIES:
-{', '.join(self.subcategories)}
+{numbered_subcategories}
 
 TYPICAL CASE PATTERNS:
 {case_examples}
@@ -504,7 +1090,7 @@ CONTEXTUAL GUIDANCE (NOT REQUIREMENTS):
 Related Keywords: {keywords_context}
 Legal Concepts: {concepts_context}
 
-MANDATORY COMPREHENSIVE ANALYSIS PROTOCOL:
+ANALYSIS PROTOCOL:
 
 STEP 1: LEGAL RELATIONSHIP MAPPING
 - Identify ALL parties and their legal relationships
@@ -530,183 +1116,126 @@ STEP 4: PROFESSIONAL COMPETENCY EVALUATION
 - Would clients typically seek {self.legal_area} representation for this matter?
 - Are there secondary legal areas that would also be involved?
 
-ACCURACY VALIDATION CHECKLIST:
-✓ Have I considered all possible {self.legal_area} connections?
-✓ Have I analyzed the legal substance beyond surface keywords?
-✓ Would three different {self.legal_area} attorneys reach the same conclusion?
-✓ Is my reasoning detailed enough to justify the classification?
-✓ Have I considered the client's likely legal needs and next steps?
-
 CLASSIFICATION STANDARDS:
 - HIGH CONFIDENCE: Clear, unambiguous {self.legal_area} matter with strong legal basis
 - MEDIUM CONFIDENCE: Probable {self.legal_area} matter with solid legal reasoning  
 - LOW CONFIDENCE: Possible {self.legal_area} connection but uncertain
 - NOT RELEVANT: No reasonable {self.legal_area} connection after thorough analysis
 
-ENHANCED JSON RESPONSE FORMAT:
-{{
-    "is_relevant": true/false,
-    "primary_legal_area": "{self.legal_area}",
-    "subcategory": "specific subcategory name",
-    "confidence_level": "high/medium/low",
-    "legal_reasoning": "DETAILED step-by-step legal analysis (minimum 100 words)",
-    "legal_relationships": ["specific legal relationships identified"],
-    "applicable_law": ["relevant statutes, regulations, legal principles"],
-    "legal_remedies": ["available legal actions, remedies, relief"],
-    "procedural_considerations": ["court jurisdiction, hearing types, filing requirements"],
-    "urgency_assessment": 0.0-1.0,
-    "complexity_assessment": 0.0-1.0,
-    "competency_match": "detailed assessment of why {self.legal_area} attorney is most qualified",
-    "secondary_areas": ["other legal areas that may be involved"],
-    "keywords_detected": ["relevant legal terms and concepts identified"],
-    "client_likely_needs": ["what the client probably needs from legal representation"],
-    "case_evolution_potential": "how this case might develop or change over time"
-}}
-
-FINAL ACCURACY CHECK: Re-read the case and your analysis. If you had to bet your professional reputation on this classification being correct, would you stand by it? Only classify as relevant if you are confident a {self.legal_area} attorney should handle this matter."""
-
-        try:
-            case_seed = hash(case_text + self.legal_area + "enhanced") % 1000000
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": analysis_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.0,
-                max_tokens=2000,
-                seed=case_seed
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            accuracy_score = AccuracyValidator.validate_classification_accuracy(result, case_text, self.legal_area)
-            
-            if not result.get("is_relevant", False) or result.get("primary_legal_area") != self.legal_area:
-                return None
-            
-            reasoning = result.get("legal_reasoning", "")
-            if len(reasoning) < 50:
-                return None
-            
-            subcategory = result.get("subcategory")
-            if not subcategory or subcategory not in self.subcategories:
-                subcategory = self._determine_best_subcategory_enhanced(case_text, result)
-            
-            classification_dict = {
-                "category": self.legal_area,
-                "subcategory": subcategory,
-                "confidence": result.get("confidence_level", "medium"),
-                "reasoning": reasoning
+RESPONSE FIELDS:
+- subcategory_index: number of the subcategory in VALID SUBCATEGORIES
+- legal_reasoning: detailed step-by-step legal analysis (minimum 100 words)
+- urgency_assessment, complexity_assessment: 0.0-1.0
+- competency_match: why a {self.legal_area} attorney is most qualified"""
+        
+        return system_prompt, analysis_prefix
+    
+    def _build_response_format(self) -> Dict[str, Any]:
+        """Strict structured-output schema for this area's enhanced analysis.
+        ``is_relevant`` comes first so an irrelevant verdict streams early."""
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "specialist_classification",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "is_relevant": {"type": "boolean"},
+                        "primary_legal_area": {"type": "string", "enum": [self.legal_area]},
+                        "subcategory_index": {"type": "integer", "enum": list(range(len(self.subcategories)))},
+                        **_ANALYSIS_DETAIL_PROPERTIES
+                    },
+                    "required": ["is_relevant", "primary_legal_area", "subcategory_index", *_ANALYSIS_DETAIL_PROPERTIES],
+                    "additionalProperties": False
+                }
             }
-            
-            validation = OutputGuardrails.validate_classification(
-                classification_dict, 
-                {self.legal_area: self.subcategories}
-            )
-            
-            if not validation["is_valid"]:
-                return None
-            
-            urgency = result.get("urgency_assessment", 0.5)
-            complexity = result.get("complexity_assessment", 0.5)
-            relevance_score = (urgency * 0.4 + complexity * 0.3 + accuracy_score * 0.3)
-            
-            confidence_score = self._calculate_dynamic_confidence(
-                result, accuracy_score, relevance_score, complexity, urgency, case_text
-            )
-            
-            processing_time = time.time() - start_time
-            keywords_detected = result.get("keywords_detected", [])
-            consistency_hash = ConsistencyValidator.generate_consistency_hash(case_text, result)
-            
-            classification = LegalClassification(
-                category=self.legal_area,
-                subcategory=subcategory,
-                confidence_score=confidence_score,
-                reasoning=reasoning,
-                keywords_found=keywords_detected,
-                relevance_score=relevance_score,
-                urgency_score=urgency,
-                agent_id=self.agent_id,
-                processing_time=processing_time,
-                fallback_used=False,
-                attempt_number=1,
-                consistency_hash=consistency_hash,
-                validation_score=accuracy_score
-            )
-            
-            print_confidence_score(self.legal_area, subcategory, confidence_score, reasoning)
-            
-            return classification
-            
-        except Exception as e:
-            raise e
+        }
     
-    def _get_legal_area_definitions(self) -> str:
-        return get_legal_area_definition(self.legal_area)
+    def enhanced_request(self, case_text: str) -> Dict[str, Any]:
+        """Chat completion parameters for the enhanced analysis of ``case_text``."""
+        analysis_prompt = f'{self._analysis_prefix}\n\nCASE FOR DETAILED ANALYSIS:\n"{case_text}"'
+        
+        case_seed = stable_seed(case_text, self.legal_area + "enhanced")
+        
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": analysis_prompt}
+            ],
+            "response_format": self._response_format,
+            "temperature": 0.0,
+            "max_tokens": 800,
+            "seed": case_seed,
+            "extra_body": self._enhanced_extra_body
+        }
     
-    def _determine_best_subcategory_enhanced(self, case_text: str, analysis_result: Dict[str, Any]) -> str:
-        if not self.subcategories:
-            return "General"
+    def build_enhanced_classification(self, case_text: str, result: Dict[str, Any],
+                                      start_time: float, features: CaseFeatures = None) -> Optional[LegalClassification]:
+        """Classification parsed from an enhanced analysis ``result``, or None when
+        this specialist judged the case outside its area."""
+        accuracy_score = AccuracyValidator.validate_classification_accuracy(result, case_text, self.legal_area)
         
-        subcategory_prompt = f"""ACCURATE SUBCATEGORY SELECTION - {self.legal_area}
-
-Based on your comprehensive legal analysis, determine the MOST ACCURATE subcategory.
-
-CASE: {case_text}
-
-DETAILED ANALYSIS RESULTS: {analysis_result}
-
-AVAILABLE SUBCATEGORIES (select the single most accurate one):
-{chr(10).join([f"{i+1}. {sub}" for i, sub in enumerate(self.subcategories)])}
-
-ACCURACY CRITERIA (apply in this exact order):
-1. Primary legal issue identified in your analysis
-2. Most specific subcategory that encompasses the main legal problem  
-3. Best match for the type of attorney specialization needed
-4. Most appropriate for the legal procedures that would be required
-
-VALIDATION: Which subcategory would a client most likely search for when seeking help with this exact legal issue?
-
-Respond with only the exact subcategory name from the list above."""
-
-        try:
-            case_seed = hash(case_text + self.legal_area + "subcategory_enhanced") % 1000000
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": f"You select the most accurate {self.legal_area} subcategory based on detailed legal analysis."},
-                    {"role": "user", "content": subcategory_prompt}
-                ],
-                temperature=0.0,
-                max_tokens=100,
-                seed=case_seed
-            )
-            
-            selected = response.choices[0].message.content.strip().strip('"').strip("'")
-            
-            if selected in self.subcategories:
-                return selected
-            
-            for subcategory in sorted(self.subcategories):
-                if subcategory.lower() in selected.lower() or selected.lower() in subcategory.lower():
-                    return subcategory
-            
-            return self.subcategories[0]
-            
-        except Exception:
-            return self.subcategories[0]
+        if not result.get("is_relevant", False) or result.get("primary_legal_area") != self.legal_area:
+            return None
+        
+        reasoning = result.get("legal_reasoning", "")
+        if len(reasoning) < 50:
+            return None
+        
+        subcategory = result["subcategory"] = self._resolve_subcategory(result)
+        
+        classification_dict = {
+            "category": self.legal_area,
+            "subcategory": subcategory,
+            "confidence": result.get("confidence_level", "medium"),
+            "reasoning": reasoning
+        }
+        
+        validation = OutputGuardrails.validate_classification(classification_dict, self.valid_categories)
+        
+        if not validation["is_valid"]:
+            return None
+        
+        urgency = result.get("urgency_assessment", 0.5)
+        complexity = result.get("complexity_assessment", 0.5)
+        relevance_score = (urgency * 0.4 + complexity * 0.3 + accuracy_score * 0.3)
+        
+        confidence_score = self._calculate_dynamic_confidence(
+            result, accuracy_score, relevance_score, complexity, urgency, case_text, features
+        )
+        
+        processing_time = time.perf_counter() - start_time
+        keywords_detected = result.get("keywords_detected", [])
+        consistency_hash = ConsistencyValidator.generate_consistency_hash(case_text, result)
+        
+        classification = LegalClassification(
+            category=self.legal_area,
+            subcategory=subcategory,
+            confidence_score=confidence_score,
+            reasoning=reasoning,
+            keywords_found=keywords_detected,
+            relevance_score=relevance_score,
+            urgency_score=urgency,
+            agent_id=self.agent_id,
+            processing_time=processing_time,
+            fallback_used=False,
+            attempt_number=1,
+            consistency_hash=consistency_hash,
+            validation_score=accuracy_score
+        )
+        
+        print_confidence_score(self.legal_area, subcategory, confidence_score, reasoning)
+        
+        return classification
     
-    def _perform_fallback_analysis(self, case_text: str, start_time: float) -> Optional[LegalClassification]:
-        fallback_prompt = f"""ENHANCED FALLBACK ANALYSIS - {self.legal_area}
+    def _build_fallback_instructions(self) -> str:
+        """Case-independent fallback instructions; the case follows in its own
+        message so every fallback request for the area shares this prefix."""
+        return f"""ENHANCED FALLBACK ANALYSIS - {self.legal_area}
 
-As a senior {self.legal_area} attorney, provide a thorough final assessment.
-
-CASE: "{case_text}"
+As a senior {self.legal_area} attorney, provide a thorough final assessment of the case that follows.
 
 COMPREHENSIVE FINAL EVALUATION:
 1. After careful consideration, does this case have ANY legitimate connection to {self.legal_area}?
@@ -726,35 +1255,96 @@ ENHANCED JSON RESPONSE:
     "confidence_level": "low/medium",
     "legal_reasoning": "thorough legal reasoning for your decision",
     "urgency_assessment": 0.0-1.0,
-    "complexity_assessment": 0.0-1.0,
-    "attorney_recommendation": "specific recommendation about {self.legal_area} representation"
+    "complexity_assessment": 0.0-1.0
 }}"""
-
+    
+    def _get_legal_area_definitions(self) -> str:
+        return self._legal_area_definition
+    
+    def _resolve_subcategory(self, result: Dict[str, Any]) -> str:
+        """Subcategory named by ``subcategory_index`` in ``result``, or by the
+        ``subcategory`` string the batched path returns."""
+        index = result.get("subcategory_index")
+        if isinstance(index, int) and not isinstance(index, bool) and 0 <= index < len(self.subcategories):
+            return self.subcategories[index]
+        subcategory = result.get("subcategory")
+        if isinstance(subcategory, str) and subcategory in self.subcategory_set:
+            return subcategory
+        return self._determine_best_subcategory_enhanced(subcategory)
+    
+    def _determine_best_subcategory_enhanced(self, selected: Optional[str]) -> str:
+        """Closest subcategory to an unrecognised ``selected`` name, matched locally."""
+        if not self.subcategories:
+            return "General"
+        if isinstance(selected, str) and selected:
+            matches = difflib.get_close_matches(selected, self.subcategories, n=1, cutoff=0.6)
+            if matches:
+                return matches[0]
+            selected_lower = selected.lower()
+            for subcategory in sorted(self.subcategories):
+                if subcategory.lower() in selected_lower or selected_lower in subcategory.lower():
+                    return subcategory
+        return self.subcategories[0]
+    
+    def _fallback_request(self, case_text: str) -> Dict[str, Any]:
+        """Chat completion parameters for the fallback analysis of ``case_text``."""
+        case_seed = stable_seed(case_text, self.legal_area + "fallback_enhanced")
+        
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                self._fallback_system_message,
+                self._fallback_instructions_message,
+                {"role": "user", "content": f'CASE: "{case_text}"'}
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.0,
+            "max_tokens": 400,
+            "seed": case_seed,
+            "extra_body": self._fallback_extra_body
+        }
+    
+    def _perform_fallback_analysis(self, case_text: str, start_time: float,
+                                   features: CaseFeatures = None) -> Optional[LegalClassification]:
+        try:
+            request = self._fallback_request(case_text)
+            cache_key = response_cache_key(request)
+            content = _RESPONSE_CACHE.get(cache_key)
+            if content is None:
+                response = self.client.chat.completions.create(**request)
+                content = response.choices[0].message.content
+            result = loads_json(content)
+            _RESPONSE_CACHE.set(cache_key, content)
+            return self._build_fallback_classification(case_text, result, start_time, features)
+        except Exception as e:
+            return None
+    
+    async def _aperform_fallback_analysis(self, async_client: openai.AsyncOpenAI, case_text: str, start_time: float,
+                                          features: CaseFeatures = None) -> Optional[LegalClassification]:
+        try:
+            request = self._fallback_request(case_text)
+            cache_key = response_cache_key(request)
+            content = _RESPONSE_CACHE.get(cache_key)
+            if content is None:
+                response = await async_client.chat.completions.create(**request)
+                content = response.choices[0].message.content
+            result = loads_json(content)
+            _RESPONSE_CACHE.set(cache_key, content)
+            return self._build_fallback_classification(case_text, result, start_time, features)
+        except Exception as e:
+            return None
+    
+    def _build_fallback_classification(self, case_text: str, result: Dict[str, Any], start_time: float,
+                                       features: CaseFeatures = None) -> Optional[LegalClassification]:
         try:
-            case_seed = hash(case_text + self.legal_area + "fallback_enhanced") % 1000000
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": f"You are conducting final accuracy-focused analysis for {self.legal_area}."},
-                    {"role": "user", "content": fallback_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.0,
-                max_tokens=1000,
-                seed=case_seed
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            
             if not result.get("is_relevant", False):
                 return None
             
             subcategory = result.get("subcategory") or self.subcategories[0]
-            if subcategory not in self.subcategories:
+            if subcategory not in self.subcategory_set:
                 subcategory = self.subcategories[0]
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             accuracy_score = AccuracyValidator.validate_classification_accuracy(result, case_text, self.legal_area)
             urgency = result.get("urgency_assessment", 0.5)
@@ -762,7 +1352,7 @@ ENHANCED JSON RESPONSE:
             relevance_score = 0.45
             
             confidence_score = max(20, self._calculate_dynamic_confidence(
-                result, accuracy_score, relevance_score, complexity, urgency, case_text
+                result, accuracy_score, relevance_score, complexity, urgency, case_text, features
             ) - 20)
             
             consistency_hash = ConsistencyValidator.generate_consistency_hash(case_text, result)
@@ -791,10 +1381,68 @@ ENHANCED JSON RESPONSE:
             return None
 
 class FinalFallbackAgent(BaseAgent):
-    def __init__(self, agent_id: str, client: openai.OpenAI, legal_categories: Dict[str, List[str]]):
+    SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a senior legal analyst focused on providing the most accurate classification possible. Your accuracy rate must be 95%+."
+    }
+    
+    def __init__(self, agent_id: str, client: openai.OpenAI, legal_categories: Dict[str, List[str]],
+                 formatted_subcategories: str = None):
         super().__init__(agent_id, client)
         self.legal_categories = legal_categories
         self.last_confidence_score = None
+        self.formatted_subcategories = formatted_subcategories or format_subcategories(legal_categories)
+        self._instructions_message = {"role": "user", "content": self._build_instructions()}
+        self._extra_body = prompt_cache_routing(self._instructions_message["content"])
+
+    def _build_instructions(self) -> str:
+        """Case-independent classification instructions; the case follows in its
+        own message so every request shares this prefix."""
+        return f"""FINAL CLASSIFICATION ANALYSIS - ACCURACY PRIORITY
+
+You are a senior legal analyst who must provide the MOST ACCURATE classification possible for the case that follows.
+
+LEGAL CATEGORIES WITH DETAILED DOMAINS:
+
+1. **Family Law**: Marriage dissolution, child custody/support, adoption, guardianship, paternity, spousal support, domestic relations
+2. **Employment Law**: Workplace discrimination, wrongful termination, wage disputes, harassment, employment contracts, labor relations  
+3. **Criminal Law**: Criminal charges, arrests, criminal defense, DUI, felonies, misdemeanors, criminal violations, plea negotiations
+4. **Real Estate Law**: Property transactions, mortgages, foreclosures, title disputes, construction disputes, property rights, zoning
+5. **Business/Corporate Law**: Commercial contracts, business disputes, partnerships, corporate matters, entertainment contracts, professional services
+6. **Immigration Law**: Deportation, visas, citizenship, asylum, immigration court proceedings, removal defense
+7. **Personal Injury Law**: Accidents, medical malpractice, negligence claims, injury compensation, premises liability, product liability
+8. **Wills, Trusts, & Estates Law**: Estate planning, probate, will contests, trust administration, inheritance, estate disputes
+9. **Bankruptcy, Finances, & Tax Law**: Debt relief, bankruptcy, tax disputes, financial restructuring, creditor issues, IRS proceedings  
+10. **Government & Administrative Law**: Government benefits, Social Security, veterans benefits, administrative appeals, regulatory matters
+11. **Product & Services Liability Law**: Defective products, consumer protection, professional malpractice, service failures, warranties
+12. **Intellectual Property Law**: Patents, copyrights, trademarks, IP infringement, creative works protection, trade secrets
+13. **Landlord/Tenant Law**: Rental disputes, eviction proceedings, lease agreements, habitability issues, tenant rights
+
+THOROUGH ANALYSIS METHODOLOGY:
+1. Identify the PRIMARY legal problem and relationships involved
+2. Determine which legal specialist would be MOST qualified to handle this
+3. Consider what type of legal action or resolution would be needed  
+4. Match to the category that BEST fits the core legal issue
+5. Select the most specific subcategory that encompasses the main problem
+
+SUBCATEGORIES BY CATEGORY:
+{self.formatted_subcategories}
+
+ACCURACY VALIDATION: Ask yourself - "If I were this person, which type of attorney would I call first?"
+
+MANDATORY CLASSIFICATION: Every case involves legal issues that can be accurately classified.
+
+ENHANCED JSON RESPONSE:
+{{
+    "category": "exact category name from the 13 categories above",
+    "subcategory": "most accurate subcategory",
+    "confidence_level": "low/medium/high", 
+    "legal_reasoning": "detailed explanation of why this is the most accurate classification",
+    "primary_legal_issue": "the main legal problem that needs to be addressed",
+    "urgency_assessment": 0.0-1.0,
+    "complexity_assessment": 0.0-1.0,
+    "attorney_type_needed": "specific type of attorney specialization required"
+}}"""
 
     def _calculate_final_confidence(self, result: Dict[str, Any], category: str, case_text: str) -> int:
         import hashlib
@@ -832,8 +1480,8 @@ class FinalFallbackAgent(BaseAgent):
         elif avg_words_per_sentence > 5:
             detail_score += 2
         
-        context_words = ['because', 'since', 'after', 'before', 'when', 'where', 'how', 'why']
-        context_count = sum(1 for word in context_words if word in case_text.lower())
+        case_lower = case_text.lower()
+        context_count = sum(1 for word in _CONTEXT_WORDS if word in case_lower)
         detail_score += min(4, context_count)
         
         reasoning = result.get("legal_reasoning", "")
@@ -872,24 +1520,14 @@ class FinalFallbackAgent(BaseAgent):
         elif len(attorney_type) > 5:
             reasoning_score += 1
         
-        legal_terms = ['law', 'legal', 'court', 'statute', 'regulation', 'procedure', 'jurisdiction', 'precedent']
-        term_count = sum(1 for term in legal_terms if term in reasoning.lower())
+        reasoning_lower = reasoning.lower()
+        term_count = sum(1 for term in _FALLBACK_LEGAL_TERMS if term in reasoning_lower)
         reasoning_score += min(3, term_count)
         
-        category_indicators = {
-            'Family Law': ['family', 'child', 'parent', 'marriage', 'divorce', 'custody', 'adoption'],
-            'Employment Law': ['job', 'work', 'employer', 'employee', 'fired', 'discrimination', 'wage'],
-            'Criminal Law': ['criminal', 'arrest', 'charge', 'court', 'police', 'guilty', 'crime'],
-            'Real Estate Law': ['property', 'house', 'real estate', 'mortgage', 'deed', 'title'],
-            'Business/Corporate Law': ['business', 'company', 'contract', 'agreement', 'corporate'],
-            'Personal Injury Law': ['injury', 'accident', 'hurt', 'medical', 'hospital', 'doctor'],
-            'Immigration Law': ['immigration', 'visa', 'citizen', 'deport', 'green card']
-        }
-        
         specificity_score = 0
-        if category in category_indicators:
-            relevant_terms = category_indicators[category]
-            matches = sum(1 for term in relevant_terms if term in case_text.lower())
+        if category in _CATEGORY_INDICATORS:
+            relevant_terms = _CATEGORY_INDICATORS[category]
+            matches = sum(1 for term in relevant_terms if term in case_lower)
             specificity_score = min(15, matches * 2.5)
         else:
             specificity_score = 8
@@ -901,7 +1539,7 @@ class FinalFallbackAgent(BaseAgent):
             hex_segment = case_hash[i:i+6]
             content_factors.append(int(hex_segment, 16) % 100)
         
-        unique_words = len(set(case_text.lower().split()))
+        unique_words = len(set(case_lower.split()))
         word_diversity = unique_words / max(len(case_text.split()), 1)
         
         content_signature = sum(content_factors[:2]) % 17 - 8
@@ -928,73 +1566,29 @@ class FinalFallbackAgent(BaseAgent):
         return final_score
         
     def process(self, case_text: str, context: Dict[str, Any] = None) -> LegalClassification:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        comprehensive_prompt = f"""FINAL CLASSIFICATION ANALYSIS - ACCURACY PRIORITY
-
-You are a senior legal analyst who must provide the MOST ACCURATE classification possible.
-
-CASE FOR CLASSIFICATION: "{case_text}"
-
-LEGAL CATEGORIES WITH DETAILED DOMAINS:
-
-1. **Family Law**: Marriage dissolution, child custody/support, adoption, guardianship, paternity, spousal support, domestic relations
-2. **Employment Law**: Workplace discrimination, wrongful termination, wage disputes, harassment, employment contracts, labor relations  
-3. **Criminal Law**: Criminal charges, arrests, criminal defense, DUI, felonies, misdemeanors, criminal violations, plea negotiations
-4. **Real Estate Law**: Property transactions, mortgages, foreclosures, title disputes, construction disputes, property rights, zoning
-5. **Business/Corporate Law**: Commercial contracts, business disputes, partnerships, corporate matters, entertainment contracts, professional services
-6. **Immigration Law**: Deportation, visas, citizenship, asylum, immigration court proceedings, removal defense
-7. **Personal Injury Law**: Accidents, medical malpractice, negligence claims, injury compensation, premises liability, product liability
-8. **Wills, Trusts, & Estates Law**: Estate planning, probate, will contests, trust administration, inheritance, estate disputes
-9. **Bankruptcy, Finances, & Tax Law**: Debt relief, bankruptcy, tax disputes, financial restructuring, creditor issues, IRS proceedings  
-10. **Government & Administrative Law**: Government benefits, Social Security, veterans benefits, administrative appeals, regulatory matters
-11. **Product & Services Liability Law**: Defective products, consumer protection, professional malpractice, service failures, warranties
-12. **Intellectual Property Law**: Patents, copyrights, trademarks, IP infringement, creative works protection, trade secrets
-13. **Landlord/Tenant Law**: Rental disputes, eviction proceedings, lease agreements, habitability issues, tenant rights
-
-THOROUGH ANALYSIS METHODOLOGY:
-1. Identify the PRIMARY legal problem and relationships involved
-2. Determine which legal specialist would be MOST qualified to handle this
-3. Consider what type of legal action or resolution would be needed  
-4. Match to the category that BEST fits the core legal issue
-5. Select the most specific subcategory that encompasses the main problem
-
-SUBCATEGORIES BY CATEGORY:
-{self._format_subcategories()}
-
-ACCURACY VALIDATION: Ask yourself - "If I were this person, which type of attorney would I call first?"
-
-MANDATORY CLASSIFICATION: Every case involves legal issues that can be accurately classified.
-
-ENHANCED JSON RESPONSE:
-{{
-    "category": "exact category name from the 13 categories above",
-    "subcategory": "most accurate subcategory",
-    "confidence_level": "low/medium/high", 
-    "legal_reasoning": "detailed explanation of why this is the most accurate classification",
-    "primary_legal_issue": "the main legal problem that needs to be addressed",
-    "urgency_assessment": 0.0-1.0,
-    "complexity_assessment": 0.0-1.0,
-    "alternative_categories": ["other categories considered but rejected"],
-    "attorney_type_needed": "specific type of attorney specialization required"
-}}"""
-
         try:
-            case_seed = hash(case_text + "final_enhanced") % 1000000
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a senior legal analyst focused on providing the most accurate classification possible. Your accuracy rate must be 95%+."},
-                    {"role": "user", "content": comprehensive_prompt}
+            request = {
+                "model": "gpt-4o-mini",
+                "messages": [
+                    self.SYSTEM_MESSAGE,
+                    self._instructions_message,
+                    {"role": "user", "content": f'CASE FOR CLASSIFICATION: "{case_text}"'}
                 ],
-                response_format={"type": "json_object"},
-                temperature=0.0,
-                max_tokens=1500,
-                seed=case_seed
-            )
-            
-            result = json.loads(response.choices[0].message.content)
+                "response_format": {"type": "json_object"},
+                "temperature": 0.0,
+                "max_tokens": 600,
+                "seed": stable_seed(case_text, "final_enhanced"),
+                "extra_body": self._extra_body
+            }
+            cache_key = response_cache_key(request)
+            content = _RESPONSE_CACHE.get(cache_key)
+            if content is None:
+                response = self.client.chat.completions.create(**request)
+                content = response.choices[0].message.content
+            result = loads_json(content)
+            _RESPONSE_CACHE.set(cache_key, content)
             
             category = result.get("category", "Business/Corporate Law")
             subcategory = result.get("subcategory")
@@ -1005,7 +1599,7 @@ ENHANCED JSON RESPONSE:
             if not subcategory or subcategory not in self.legal_categories[category]:
                 subcategory = self.legal_categories[category][0]
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             accuracy_score = AccuracyValidator.validate_classification_accuracy(result, case_text, category)
             confidence_score = self._calculate_final_confidence(result, category, case_text)
@@ -1033,8 +1627,8 @@ ENHANCED JSON RESPONSE:
             return classification
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            fallback_score = 20 + (abs(hash(case_text + "fallback")) % 25)
+            processing_time = time.perf_counter() - start_time
+            fallback_score = 20 + (stable_seed(case_text, "fallback") % 25)
             fallback_classification = LegalClassification(
                 category="Business/Corporate Law",
                 subcategory="Business Disputes",
@@ -1054,12 +1648,168 @@ ENHANCED JSON RESPONSE:
             print_confidence_score("Business/Corporate Law", "Business Disputes", fallback_score, fallback_classification.reasoning)
             return fallback_classification
     
-    def _format_subcategories(self) -> str:
-        formatted = []
-        for category, subcategories in self.legal_categories.items():
-            subcats = ", ".join(subcategories)
-            formatted.append(f"**{category}**: {subcats}")
-        return "\n".join(formatted)
+    def _format_subcategories(self) -> str:
+        return self.formatted_subcategories
+
+class MultiLabelClassifierAgent(BaseAgent):
+    SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a senior legal intake analyst who routes cases to the right legal specialists."
+    }
+    
+    def __init__(self, agent_id: str, client: openai.OpenAI, legal_categories: Dict[str, List[str]],
+                 formatted_subcategories: str = None):
+        super().__init__(agent_id, client)
+        self.role = AgentRole.TRIAGE
+        self.legal_categories = legal_categories
+        self.formatted_subcategories = formatted_subcategories or format_subcategories(legal_categories)
+
+    def _triage_request(self, case_text: str) -> Dict[str, Any]:
+        triage_prompt = f"""MULTI-LABEL LEGAL TRIAGE
+
+CASE: "{case_text}"
+
+LEGAL CATEGORIES AND SUBCATEGORIES:
+{self.formatted_subcategories}
+
+Rank every legal category that plausibly applies to this case, most relevant first. Omit categories with no reasonable connection.
+
+JSON RESPONSE FORMAT:
+{{
+    "rankings": [
+        {{
+            "category": "exact category name from the list above",
+            "subcategory": "exact subcategory name from that category",
+            "confidence_level": "high/medium/low",
+            "reasoning": "one or two sentences on why this category applies"
+        }}
+    ]
+}}"""
+        
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                self.SYSTEM_MESSAGE,
+                {"role": "user", "content": triage_prompt}
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.0,
+            "max_tokens": 600,
+            "seed": stable_seed(case_text, "triage")
+        }
+    
+    def _parse_rankings(self, content: str) -> List[Dict[str, Any]]:
+        rankings = loads_json(content).get("rankings", [])
+        return [r for r in rankings if isinstance(r, dict) and r.get("category") in self.legal_categories]
+
+    def process(self, case_text: str, context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Rank the legal categories that apply to ``case_text`` in a single call.
+
+        Returns the rankings most relevant first, restricted to known
+        categories, or an empty list when the call or its JSON fails.
+        """
+        try:
+            response = self.client.chat.completions.create(**self._triage_request(case_text))
+            return self._parse_rankings(response.choices[0].message.content)
+        except Exception:
+            return []
+    
+    async def aprocess(self, case_text: str, context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        async_client = (context or {}).get("async_client")
+        if async_client is None:
+            return await super().aprocess(case_text, context)
+        try:
+            response = await async_client.chat.completions.create(**self._triage_request(case_text))
+            return self._parse_rankings(response.choices[0].message.content)
+        except Exception:
+            return []
+
+class EmbeddingScreenerAgent(BaseAgent):
+    """Ranks legal areas by cosine similarity between the case and each area's profile.
+
+    Costs one embeddings call per case (plus one per process for the area
+    profiles), so it is used to narrow the specialists when the LLM triage
+    produces no rankings.
+    """
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    
+    def __init__(self, agent_id: str, client: openai.OpenAI, area_profiles: Dict[str, str]):
+        super().__init__(agent_id, client)
+        self.role = AgentRole.TRIAGE
+        self.area_profiles = area_profiles
+    
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        norm = sum(x * x for x in vector) ** 0.5 or 1.0
+        return [x / norm for x in vector]
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        response = self.client.embeddings.create(model=self.EMBEDDING_MODEL, input=texts)
+        return [self._normalize(item.embedding) for item in sorted(response.data, key=lambda item: item.index)]
+    
+    def _area_vectors(self) -> Dict[str, List[float]]:
+        cache_key = (self.EMBEDDING_MODEL, text_digest("\n".join(self.area_profiles.values())))
+        area_vectors = _EMBEDDING_CACHE.get(cache_key)
+        if area_vectors is None:
+            areas = list(self.area_profiles)
+            area_vectors = dict(zip(areas, self._embed([self.area_profiles[area] for area in areas])))
+            _EMBEDDING_CACHE.set(cache_key, area_vectors)
+        return area_vectors
+    
+    def process(self, case_text: str, context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        try:
+            area_vectors = self._area_vectors()
+            case_vector = self._embed([case_text])[0]
+            
+            scored = sorted(
+                ((sum(a * b for a, b in zip(vector, case_vector)), area) for area, vector in area_vectors.items()),
+                reverse=True
+            )
+            
+            return [
+                {"category": area, "confidence_level": "low", "similarity": round(similarity, 4)}
+                for similarity, area in scored
+            ]
+            
+        except Exception:
+            return []
+
+class KeywordScreenerAgent(BaseAgent):
+    """Ranks legal areas by how many of each specialist's keywords occur in the case.
+
+    Makes no API calls. Every keyword is flattened into one inverted index
+    from term to the areas that list it, so single words are scored with
+    one dict lookup per case token and phrases with one substring check
+    per distinct phrase.
+    """
+    def __init__(self, agent_id: str, client: openai.OpenAI, area_keywords: Dict[str, List[str]]):
+        super().__init__(agent_id, client)
+        self.role = AgentRole.TRIAGE
+        self.areas = tuple(area_keywords)
+        word_index = {}
+        phrase_index = {}
+        for area_id, keywords in enumerate(area_keywords.values()):
+            for keyword in {keyword.lower() for keyword in keywords}:
+                index = word_index if _WORD_RE.fullmatch(keyword) else phrase_index
+                index.setdefault(keyword, []).append(area_id)
+        self.word_index = {word: tuple(ids) for word, ids in word_index.items()}
+        self.phrase_index = tuple((phrase, tuple(ids)) for phrase, ids in phrase_index.items())
+    
+    def process(self, case_text: str, context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        features = (context or {}).get("case_features") or CaseFeatures.from_text(case_text)
+        case_lower = features.case_lower
+        scores = [0] * len(self.areas)
+        
+        for word in features.tokens:
+            for area_id in self.word_index.get(word, ()):
+                scores[area_id] += 1
+        for phrase, area_ids in self.phrase_index:
+            if phrase in case_lower:
+                for area_id in area_ids:
+                    scores[area_id] += 1
+        
+        ranked = sorted((area_id for area_id, hits in enumerate(scores) if hits), key=lambda area_id: -scores[area_id])
+        return [{"category": self.areas[area_id], "confidence_level": "low", "keyword_hits": scores[area_id]} for area_id in ranked]
 
 class EnhancedCoordinatorAgent(BaseAgent):
     def __init__(self, agent_id: str, client: openai.OpenAI):
@@ -1077,9 +1827,6 @@ class EnhancedCoordinatorAgent(BaseAgent):
             classifications, threshold=0.6
         )
         
-        accuracy_scores = [c.validation_score for c in classifications]
-        overall_accuracy = sum(accuracy_scores) / len(accuracy_scores) if accuracy_scores else 0.0
-        
         classifications.sort(key=lambda x: (
             not x.fallback_used,
             x.validation_score,
@@ -1093,33 +1840,45 @@ class EnhancedCoordinatorAgent(BaseAgent):
         primary = classifications[0]
         secondaries = [c for c in classifications[1:] if c.category != primary.category]
         
-        complexity_level = self._assess_complexity_enhanced(classifications)
-        requires_multiple_attorneys = len(set(c.category for c in classifications)) > 1
-        
-        import time
-        import hashlib
-        
-        confidence_scores = [c.confidence_score for c in classifications]
-        validation_scores = [c.validation_score for c in classifications]
-        
-        if confidence_scores:
-            avg_confidence = sum(confidence_scores) / len(confidence_scores)
-            confidence_spread = max(confidence_scores) - min(confidence_scores)
-            high_confidence_count = sum(1 for score in confidence_scores if score >= 80)
-        else:
-            avg_confidence = 50
-            confidence_spread = 0
-            high_confidence_count = 0
-            
-        if validation_scores:
-            avg_validation = sum(validation_scores) / len(validation_scores)
-        else:
-            avg_validation = 0.5
+        total_processing_time = 0.0
+        confidence_total = validation_total = relevance_total = urgency_total = 0.0
+        min_confidence = max_confidence = primary.confidence_score
+        high_confidence_count = fallback_count = 0
+        categories = set()
+        agents_consulted = []
         
-        fallback_count = sum(1 for c in classifications if c.fallback_used)
-        non_fallback_count = len(classifications) - fallback_count
+        for c in classifications:
+            total_processing_time += c.processing_time
+            confidence_total += c.confidence_score
+            validation_total += c.validation_score
+            relevance_total += c.relevance_score
+            urgency_total += c.urgency_score
+            min_confidence = min(min_confidence, c.confidence_score)
+            max_confidence = max(max_confidence, c.confidence_score)
+            if c.confidence_score >= 80:
+                high_confidence_count += 1
+            if c.fallback_used:
+                fallback_count += 1
+            categories.add(c.category)
+            agents_consulted.append(c.agent_id)
+        
+        num_classifications = len(classifications)
+        overall_accuracy = validation_total / num_classifications
+        avg_confidence = confidence_total / num_classifications
+        avg_validation = overall_accuracy
+        confidence_spread = max_confidence - min_confidence
+        
+        complexity_level = self._assess_complexity_enhanced(
+            num_areas=len(categories),
+            avg_relevance=relevance_total / num_classifications,
+            avg_urgency=urgency_total / num_classifications,
+            avg_accuracy=overall_accuracy,
+            fallback_ratio=fallback_count / num_classifications,
+            high_confidence_ratio=high_confidence_count / num_classifications
+        )
+        requires_multiple_attorneys = len(categories) > 1
         
-        stability_factor = (non_fallback_count / len(classifications)) if classifications else 0
+        stability_factor = (num_classifications - fallback_count) / num_classifications
         consensus_strength = overall_consistency
         
         base_consensus = (
@@ -1140,12 +1899,8 @@ class EnhancedCoordinatorAgent(BaseAgent):
         case_words = len(case_text.split())
         case_sentences = len([s for s in case_text.split('.') if len(s.strip()) > 5])
         
-        complexity_indicators = [
-            'contract', 'agreement', 'court', 'lawsuit', 'legal', 'attorney',
-            'damages', 'liability', 'breach', 'violation', 'statute', 'regulation'
-        ]
-        
-        complexity_terms = sum(1 for term in complexity_indicators if term in case_text.lower())
+        case_lower = case_text.lower()
+        complexity_terms = sum(1 for term in _COMPLEXITY_INDICATORS if term in case_lower)
         
         case_complexity_factor = (
             (case_words / 50) +
@@ -1169,7 +1924,7 @@ class EnhancedCoordinatorAgent(BaseAgent):
                 final_consensus = max(20, min(94, final_consensus))
         
         hour_seed = int(time.time() / 3600) % 100
-        content_time_factor = (content_metrics[4] + hour_seed) % 5 - 2
+        content_time_factor = (content_metrics[-1] + hour_seed) % 5 - 2
         final_consensus += content_time_factor
         
         final_consensus = max(20, min(94, final_consensus))
@@ -1177,9 +1932,6 @@ class EnhancedCoordinatorAgent(BaseAgent):
         self.last_consensus_score = final_consensus
         confidence_consensus = final_consensus
         
-        total_processing_time = sum(c.processing_time for c in classifications)
-        agents_consulted = [c.agent_id for c in classifications]
-        
         print(f"\n=== CONSENSUS ANALYSIS ===")
         print(f"Primary: {primary.category} - {primary.subcategory}")
         print(f"Primary Confidence: {primary.confidence_score}/100 ({primary.confidence_label})")
@@ -1201,20 +1953,15 @@ class EnhancedCoordinatorAgent(BaseAgent):
             accuracy_score=overall_accuracy
         )
     
-    def _assess_complexity_enhanced(self, classifications: List[LegalClassification]) -> str:
-        num_areas = len(set(c.category for c in classifications))
-        avg_relevance = sum(c.relevance_score for c in classifications) / len(classifications)
-        avg_urgency = sum(c.urgency_score for c in classifications) / len(classifications)
-        avg_accuracy = sum(c.validation_score for c in classifications) / len(classifications)
-        fallback_count = sum(1 for c in classifications if c.fallback_used)
-        high_confidence_count = sum(1 for c in classifications if c.confidence_score >= 80)
-        
+    def _assess_complexity_enhanced(self, num_areas: int, avg_relevance: float, avg_urgency: float,
+                                    avg_accuracy: float, fallback_ratio: float,
+                                    high_confidence_ratio: float) -> str:
         complexity_score = (
             (num_areas - 1) * 0.25 +
             avg_relevance * 0.2 +
             avg_urgency * 0.15 +
-            (fallback_count / len(classifications)) * 0.15 +
-            (1 - high_confidence_count / len(classifications)) * 0.1 +
+            fallback_ratio * 0.15 +
+            (1 - high_confidence_ratio) * 0.1 +
             (1 - avg_accuracy) * 0.15
         )
         
@@ -1225,95 +1972,485 @@ class EnhancedCoordinatorAgent(BaseAgent):
         else:
             return "complex"
 
+_LEGAL_CATEGORIES = MappingProxyType({
+    "Family Law": (
+        "Adoptions", "Child Custody & Visitation", "Child Support", "Divorce",
+        "Guardianship", "Paternity", "Separations", "Spousal Support or Alimony"
+    ),
+    "Employment Law": (
+        "Disabilities", "Employment Contracts", "Employment Discrimination", 
+        "Pensions and Benefits", "Sexual Harassment", "Wages and Overtime Pay", 
+        "Workplace Disputes", "Wrongful Termination"
+    ),
+    "Criminal Law": (
+        "General Criminal Defense", "Environmental Violations", "Drug Crimes",
+        "Drunk Driving/DUI/DWI", "Felonies", "Misdemeanors", 
+        "Speeding and Moving Violations", "White Collar Crime", "Tax Evasion"
+    ),
+    "Real Estate Law": (
+        "Commercial Real Estate", "Condominiums and Cooperatives", "Construction Disputes",
+        "Foreclosures", "Mortgages", "Purchase and Sale of Residence", "Title and Boundary Disputes"
+    ),
+    "Business/Corporate Law": (
+        "Breach of Contract", "Corporate Tax", "Business Disputes", "Buying and Selling a Business",
+        "Contract Drafting and Review", "Corporations, LLCs, Partnerships, etc.", "Entertainment Law"
+    ),
+    "Immigration Law": (
+        "Citizenship", "Deportation", "Permanent Visas or Green Cards", "Temporary Visas"
+    ),
+    "Personal Injury Law": (
+        "Automobile Accidents", "Dangerous Property or Buildings", "Defective Products",
+        "Medical Malpractice", "Personal Injury (General)"
+    ),
+    "Wills, Trusts, & Estates Law": (
+        "Contested Wills or Probate", "Drafting Wills and Trusts", "Estate Administration", "Estate Planning"
+    ),
+    "Bankruptcy, Finances, & Tax Law": (
+        "Collections", "Consumer Bankruptcy", "Consumer Credit", "Income Tax", "Property Tax"
+    ),
+    "Government & Administrative Law": (
+        "Education and Schools", "Social Security – Disability", "Social Security – Retirement",
+        "Social Security – Dependent Benefits", "Social Security – Survivor Benefits", "Veterans Benefits",
+        "General Administrative Law", "Environmental Law", "Liquor Licenses", "Constitutional Law"
+    ),
+    "Product & Services Liability Law": (
+        "Attorney Malpractice", "Defective Products", "Warranties", "Consumer Protection and Fraud"
+    ),
+    "Intellectual Property Law": (
+        "Copyright", "Patents", "Trademarks"
+    ),
+    "Landlord/Tenant Law": (
+        "General Landlord and Tenant Issues",
+    )
+})
+
+_SPECIALIST_SPECS = tuple(
+    (
+        f"enhanced-specialist-{area.lower().replace(' ', '-').replace('/', '-')}-{i+1:03d}",
+        area,
+        tuple(config["keywords"]),
+        _LEGAL_CATEGORIES.get(area, ("General",)),
+        tuple(config["case_examples"]),
+        tuple(config["legal_concepts"]),
+    )
+    for i, (area, config) in enumerate(SPECIALIST_CONFIGURATIONS.items())
+)
+
+_SPECIALIST_BATCH_SCHEMA = {
+    "name": "specialist_classifications",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "classifications": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "is_relevant": {"type": "boolean"},
+                        "primary_legal_area": {"type": "string", "enum": list(_LEGAL_CATEGORIES)},
+                        "subcategory": {"type": "string"},
+                        **_ANALYSIS_DETAIL_PROPERTIES
+                    },
+                    "required": ["is_relevant", "primary_legal_area", "subcategory", *_ANALYSIS_DETAIL_PROPERTIES],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["classifications"],
+        "additionalProperties": False
+    }
+}
+
+_SCREENER_AREA_TEXTS = MappingProxyType({
+    area: " ".join(config["legal_concepts"] + config["case_examples"] + config["keywords"])
+    for area, config in SPECIALIST_CONFIGURATIONS.items()
+})
+
 class EnhancedMultiAgentLegalAnalyzer:
     SYSTEM_VERSION = "5.6.0"
     PROMPT_VERSION = "2024-07-21-full-spectrum-distribution"
     
-    LEGAL_CATEGORIES = {
-        "Family Law": [
-            "Adoptions", "Child Custody & Visitation", "Child Support", "Divorce",
-            "Guardianship", "Paternity", "Separations", "Spousal Support or Alimony"
-        ],
-        "Employment Law": [
-            "Disabilities", "Employment Contracts", "Employment Discrimination", 
-            "Pensions and Benefits", "Sexual Harassment", "Wages and Overtime Pay", 
-            "Workplace Disputes", "Wrongful Termination"
-        ],
-        "Criminal Law": [
-            "General Criminal Defense", "Environmental Violations", "Drug Crimes",
-            "Drunk Driving/DUI/DWI", "Felonies", "Misdemeanors", 
-            "Speeding and Moving Violations", "White Collar Crime", "Tax Evasion"
-        ],
-        "Real Estate Law": [
-            "Commercial Real Estate", "Condominiums and Cooperatives", "Construction Disputes",
-            "Foreclosures", "Mortgages", "Purchase and Sale of Residence", "Title and Boundary Disputes"
-        ],
-        "Business/Corporate Law": [
-            "Breach of Contract", "Corporate Tax", "Business Disputes", "Buying and Selling a Business",
-            "Contract Drafting and Review", "Corporations, LLCs, Partnerships, etc.", "Entertainment Law"
-        ],
-        "Immigration Law": [
-            "Citizenship", "Deportation", "Permanent Visas or Green Cards", "Temporary Visas"
-        ],
-        "Personal Injury Law": [
-            "Automobile Accidents", "Dangerous Property or Buildings", "Defective Products",
-            "Medical Malpractice", "Personal Injury (General)"
-        ],
-        "Wills, Trusts, & Estates Law": [
-            "Contested Wills or Probate", "Drafting Wills and Trusts", "Estate Administration", "Estate Planning"
-        ],
-        "Bankruptcy, Finances, & Tax Law": [
-            "Collections", "Consumer Bankruptcy", "Consumer Credit", "Income Tax", "Property Tax"
-        ],
-        "Government & Administrative Law": [
-            "Education and Schools", "Social Security – Disability", "Social Security – Retirement",
-            "Social Security – Dependent Benefits", "Social Security – Survivor Benefits", "Veterans Benefits",
-            "General Administrative Law", "Environmental Law", "Liquor Licenses", "Constitutional Law"
-        ],
-        "Product & Services Liability Law": [
-            "Attorney Malpractice", "Defective Products", "Warranties", "Consumer Protection and Fraud"
-        ],
-        "Intellectual Property Law": [
-            "Copyright", "Patents", "Trademarks"
-        ],
-        "Landlord/Tenant Law": [
-            "General Landlord and Tenant Issues"
-        ]
+    SUMMARY_CONTEXT_CHARS = 4000
+    SUMMARY_MAX_TOKENS = 1000
+    
+    SUMMARY_SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a legal document summarizer. Return valid JSON with title and summary fields."
+    }
+    QUESTIONNAIRE_TITLE_SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "Generate concise legal case titles, maximum 70 characters, no PII."
+    }
+    QUESTIONNAIRE_SUMMARY_SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a senior legal document summarizer. You MUST return ONLY valid JSON with the exact nested structure requested. Do not include any text before or after the JSON object."
+    }
+    
+    LEGAL_CATEGORIES = _LEGAL_CATEGORIES
+    FORMATTED_SUBCATEGORIES = format_subcategories(_LEGAL_CATEGORIES)
+    
+    CATEGORIES_DIGEST = text_digest(json.dumps(dict(_LEGAL_CATEGORIES), sort_keys=True))
+
+    FALLBACK_ANALYSIS_FIELDS = {
+        "case_title": None,
+        "fallback_used": True,
+        "gibberish_detected": False,
+        "secondary_issues": [],
+        "case_complexity": "unknown",
+        "requires_multiple_attorneys": False,
+        "consistency_score": 1.0,
+        "validation_passed": True,
+        "total_legal_areas": 1,
+        "agent_performance": {},
+        "text_quality": {"quality_acceptable": False},
+        "input_validation": {"is_valid": True}
+    }
+    
+    EMERGENCY_ANALYSIS_TEMPLATE = {
+        **FALLBACK_ANALYSIS_FIELDS,
+        "reasoning": "Emergency fallback classification",
+        "method": "emergency_fallback",
+        "confidence_consensus": 45,
+        "consensus_label": get_confidence_label(45),
+        "key_details": ["Emergency classification"]
+    }
+
+    ULTIMATE_FALLBACK_RESPONSE = {
+        "status": "success",
+        "method": "ultimate_fallback",
+        "timestamp": None,
+        "original_text": None,
+        "analysis": {
+            **FALLBACK_ANALYSIS_FIELDS,
+            "category": "Business/Corporate Law",
+            "subcategory": "Business Disputes",
+            "confidence": "Medium",
+            "confidence_score": 45,
+            "reasoning": "Ultimate fallback classification - manual review recommended",
+            "method": "ultimate_fallback",
+            "confidence_consensus": 50,
+            "consensus_label": "Medium",
+            "accuracy_score": 0.6,
+            "agents_consulted": ["ultimate-fallback"],
+            "total_processing_time": 0.1,
+            "key_details": ["Ultimate fallback"]
+        },
+        "system_version": SYSTEM_VERSION,
+        "prompt_version": PROMPT_VERSION
+    }
+
+    QUESTIONNAIRE_FALLBACK_ANALYSIS_TEMPLATE = {
+        "confidence": "Medium",
+        "confidence_score": 70,
+        "confidence_label": "Medium",
+        "reasoning": "Questionnaire fallback classification due to processing error",
+        "method": "questionnaire_fallback",
+        "gibberish_detected": False,
+        "fallback_used": True,
+        "secondary_issues": [],
+        "case_complexity": "standard",
+        "requires_multiple_attorneys": False,
+        "confidence_consensus": 70,
+        "consensus_label": "Medium",
+        "accuracy_score": 0.7,
+        "consistency_score": 1.0,
+        "validation_passed": True,
+        "total_legal_areas": 1,
+        "agents_consulted": ["questionnaire-fallback"],
+        "total_processing_time": 0.1,
+        "agent_performance": {"questionnaire-fallback": {"status": "fallback", "confidence_score": 70}},
+        "text_quality": {"quality_acceptable": True, "has_legal_context": True},
+        "input_validation": {"is_valid": True},
+        "pii_removal_applied": False,
+        "pii_reduction_percentage": 0,
+        "key_details": ["Questionnaire fallback due to error"]
+    }
+    
+    TEXT_QUALITY_REJECTED = {
+        "original_words": 0,
+        "cleaned_words": 0,
+        "reduction_percentage": 100,
+        "has_legal_context": False,
+        "sentence_count": 0,
+        "avg_sentence_length": 0,
+        "quality_acceptable": False,
+        "gibberish_detected": True
     }
+    
+    SPECIALIST_TOP_K = 2
+    BATCHED_SPECIALISTS = False
+    # Cosine similarity at which a paraphrase of an analyzed case reuses its
+    # classification (e.g. 0.92); None disables the semantic cache
+    SEMANTIC_CACHE_THRESHOLD = None
 
     def __init__(self, api_key: str):
-        self.client = openai.OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self.client = get_openai_client(api_key)
         self.pii_remover = PIIRemover()
         
         self.specialist_agents = self._create_enhanced_specialist_agents()
         self.coordinator = EnhancedCoordinatorAgent("coordinator-001", self.client)
-        self.final_fallback = FinalFallbackAgent("final-fallback-001", self.client, self.LEGAL_CATEGORIES)
+        self.final_fallback = FinalFallbackAgent(
+            "final-fallback-001", self.client, self.LEGAL_CATEGORIES, self.FORMATTED_SUBCATEGORIES
+        )
+        self.triage = MultiLabelClassifierAgent(
+            "triage-001", self.client, self.LEGAL_CATEGORIES, self.FORMATTED_SUBCATEGORIES
+        )
+        self.screener = EmbeddingScreenerAgent("screener-001", self.client, _SCREENER_AREA_TEXTS)
+        self.keyword_screener = KeywordScreenerAgent("keyword-screener-001", self.client, {
+            spec[1]: spec[2] for spec in _SPECIALIST_SPECS
+        })
 
     def _create_enhanced_specialist_agents(self) -> List[EnhancedLegalSpecialistAgent]:
         agents = []
         
-        for i, (area, config) in enumerate(SPECIALIST_CONFIGURATIONS.items()):
-            agent_id = f"enhanced-specialist-{area.lower().replace(' ', '-').replace('/', '-')}-{i+1:03d}"
-            subcategories = self.LEGAL_CATEGORIES.get(area, ["General"])
-            
+        for agent_id, area, keywords, subcategories, case_examples, legal_concepts in _SPECIALIST_SPECS:
             agent = EnhancedLegalSpecialistAgent(
                 agent_id=agent_id,
                 client=self.client,
                 legal_area=area,
-                keywords=config["keywords"],
+                keywords=keywords,
                 subcategories=subcategories,
-                case_descriptions=config["case_examples"],
-                legal_concepts=config["legal_concepts"],
+                case_descriptions=case_examples,
+                legal_concepts=legal_concepts,
                 legal_categories=self.LEGAL_CATEGORIES
             )
             agents.append(agent)
             
         return agents
 
+    def _select_specialists(self, rankings: List[Dict[str, Any]]) -> List[EnhancedLegalSpecialistAgent]:
+        """Pick the specialists that validate the triage's top-ranked areas.
+
+        A high-confidence leader is confirmed by its specialist alone; otherwise
+        the top ``SPECIALIST_TOP_K`` areas are disambiguated. Without usable
+        rankings every specialist is deployed.
+        """
+        if not rankings:
+            return self.specialist_agents
+        
+        top_k = 1 if rankings[0].get("confidence_level") == "high" else self.SPECIALIST_TOP_K
+        agents_by_area = {agent.legal_area: agent for agent in self.specialist_agents}
+        
+        selected = []
+        for ranking in rankings:
+            agent = agents_by_area.get(ranking["category"])
+            if agent is not None and agent not in selected:
+                selected.append(agent)
+            if len(selected) == top_k:
+                break
+        
+        return selected or self.specialist_agents
+
+    def clean_case_text(self, case_text: str) -> str:
+        """PII-scrubbed ``case_text``, memoized so each distinct text is scrubbed once."""
+        cache_key = text_digest(case_text)
+        cleaned_text = _PII_CACHE.get(cache_key)
+        if cleaned_text is None:
+            cleaned_text = self.pii_remover.clean_text(case_text).cleaned_text
+            _PII_CACHE.set(cache_key, cleaned_text)
+        return cleaned_text
+
+    def _semantic_cache_result(self, cleaned_text: str, snapshot: Tuple[str, str, int],
+                               start_time: float) -> Tuple[CaseAnalysisResult, Dict[str, Any], int]:
+        """Consensus for ``cleaned_text`` from the ``(category, subcategory,
+        confidence_score)`` cached for a near-duplicate case. Only those labels
+        are reused; reasoning, timing and hashes are built for this case."""
+        category, subcategory, confidence_score = snapshot
+        classification = LegalClassification(
+            category=category,
+            subcategory=subcategory,
+            confidence_score=confidence_score,
+            reasoning=(f"Classified as {subcategory} ({category}) because this case closely matches "
+                       f"a previously analyzed case; specialist analysis was not rerun."),
+            keywords_found=[],
+            relevance_score=0.5,
+            urgency_score=0.5,
+            agent_id="semantic-cache",
+            processing_time=time.perf_counter() - start_time,
+            consistency_hash=ConsistencyValidator.generate_consistency_hash(
+                cleaned_text, {"category": category, "subcategory": subcategory}
+            ),
+            validation_score=0.6
+        )
+        analysis_result = self.coordinator.process(cleaned_text, {"classifications": [classification]})
+        return analysis_result, {"semantic-cache": {"status": "semantic_cache_hit"}}, 0
+
+    async def _embed_case(self, cleaned_text: str) -> Optional[List[float]]:
+        """Unit embedding of ``cleaned_text`` for the semantic cache, or None if
+        the embeddings call fails."""
+        try:
+            return (await asyncio.to_thread(self.screener._embed, [cleaned_text]))[0]
+        except Exception as e:
+            print(f"Case embedding failed, skipping semantic cache: {str(e)}")
+            return None
+
+    def _batched_specialist_request(self, cleaned_text: str,
+                                    agents: List[EnhancedLegalSpecialistAgent]) -> Dict[str, Any]:
+        """One chat completion asking every agent's legal area to be assessed at once."""
+        area_briefs = "\n\n".join(agent._batch_brief for agent in agents)
+        
+        system_prompt = """You are a panel of senior attorneys, one per legal area, each with 25+ years of experience classifying cases.
+Base every decision on substantive legal analysis, not superficial keyword matching, and err on the side of inclusion for borderline cases."""
+        
+        user_prompt = f"""MULTI-SPECIALIST LEGAL ANALYSIS
+
+Assess the case below once for EACH legal area listed, returning exactly one classification per area in the order given.
+
+{area_briefs}
+
+For each area:
+- is_relevant: true only if an attorney in that area should handle this matter
+- primary_legal_area: the area being assessed, exactly as named above
+- subcategory: one of that area's valid subcategories
+- legal_reasoning: detailed step-by-step legal analysis (minimum 100 words when relevant)
+- urgency_assessment and complexity_assessment: 0.0-1.0
+
+CASE FOR DETAILED ANALYSIS: "{cleaned_text}"
+"""
+        
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "response_format": {"type": "json_schema", "json_schema": _SPECIALIST_BATCH_SCHEMA},
+            "temperature": 0.0,
+            "max_tokens": 600 * len(agents),
+            "seed": stable_seed(cleaned_text, "batched-specialists")
+        }
+
+    async def _batched_specialist_call(self, cleaned_text: str, agents: List[EnhancedLegalSpecialistAgent],
+                                       async_client: openai.AsyncOpenAI,
+                                       features: CaseFeatures) -> Optional[List[Tuple[EnhancedLegalSpecialistAgent, Any]]]:
+        """Classify ``cleaned_text`` for all ``agents`` in a single request.
+
+        Returns ``(agent, classification)`` pairs in the shape produced by
+        ``gather_specialists``, or None when the batched response cannot be
+        parsed so the caller can fall back to the per-agent path.
+        """
+        start_time = time.perf_counter()
+        try:
+            response = await async_client.chat.completions.create(
+                **self._batched_specialist_request(cleaned_text, agents)
+            )
+            items = loads_json(response.choices[0].message.content)["classifications"]
+        except Exception as e:
+            print(f"Batched specialist call failed, using per-agent analysis: {str(e)}")
+            return None
+        
+        results_by_area = {
+            item.get("primary_legal_area"): item for item in items if isinstance(item, dict)
+        }
+        
+        classifications = []
+        for agent in agents:
+            result = results_by_area.get(agent.legal_area)
+            classification = None
+            if result is not None:
+                classification = agent.build_enhanced_classification(cleaned_text, result, start_time, features)
+            classifications.append((agent, classification))
+        return classifications
+
+    async def _run_agents(self, cleaned_text: str,
+                          async_client: openai.AsyncOpenAI) -> Tuple[CaseAnalysisResult, Dict[str, Any], int]:
+        """Triage, run the selected specialists and reach a coordinator consensus.
+
+        Returns the consensus, the per-agent performance map and the number of
+        specialists deployed.
+        """
+        valid_classifications = []
+        agent_performance = {}
+        features = CaseFeatures.from_text(cleaned_text)
+        
+        print(f"\n--- SPECIALIST AGENT ANALYSIS ---")
+        rankings = await self.triage.aprocess(cleaned_text, {"async_client": async_client})
+        agent_performance[self.triage.agent_id] = {
+            "status": "triage",
+            "ranked_areas": [r["category"] for r in rankings]
+        }
+        if not rankings:
+            rankings = await self.screener.aprocess(cleaned_text)
+            agent_performance[self.screener.agent_id] = {
+                "status": "screening",
+                "ranked_areas": [r["category"] for r in rankings]
+            }
+        if not rankings:
+            rankings = self.keyword_screener.process(cleaned_text, {"case_features": features})
+            agent_performance[self.keyword_screener.agent_id] = {
+                "status": "keyword_screening",
+                "ranked_areas": [r["category"] for r in rankings]
+            }
+        selected_agents = self._select_specialists(rankings)
+        print(f"Triage ranked {len(rankings)} legal areas")
+        print(f"Deploying {len(selected_agents)} specialist agents...")
+        
+        specialist_context = {
+            "case_features": features,
+            "cancel_event": threading.Event(),
+            "async_client": async_client
+        }
+        outcomes = None
+        if self.BATCHED_SPECIALISTS:
+            outcomes = await self._batched_specialist_call(cleaned_text, selected_agents, async_client, features)
+        if outcomes is None:
+            outcomes = await gather_specialists(selected_agents, cleaned_text, specialist_context)
+        
+        for agent, result in outcomes:
+            if isinstance(result, LegalClassification):
+                valid_classifications.append(result)
+                agent_performance[agent.agent_id] = {
+                    "status": "success",
+                    "classification": f"{result.category} - {result.subcategory}",
+                    "relevance_score": result.relevance_score,
+                    "processing_time": result.processing_time,
+                    "fallback_used": result.fallback_used,
+                    "confidence_score": result.confidence_score,
+                    "confidence_label": result.confidence_label,
+                    "consistency_hash": result.consistency_hash,
+                    "attempt_number": result.attempt_number,
+                    "validation_score": result.validation_score
+                }
+            elif isinstance(result, asyncio.CancelledError):
+                agent_performance[agent.agent_id] = {"status": "cancelled"}
+            elif isinstance(result, Exception):
+                agent_performance[agent.agent_id] = {"status": "error", "error": str(result)}
+            else:
+                agent_performance[agent.agent_id] = {"status": "not_relevant"}
+        
+        if not valid_classifications:
+            print(f"\nNo specialist matches found, deploying final fallback agent...")
+            fallback_classification = await self.final_fallback.aprocess(cleaned_text)
+            valid_classifications.append(fallback_classification)
+            agent_performance[self.final_fallback.agent_id] = {
+                "status": "final_fallback",
+                "classification": f"{fallback_classification.category} - {fallback_classification.subcategory}",
+                "relevance_score": fallback_classification.relevance_score,
+                "processing_time": fallback_classification.processing_time,
+                "fallback_used": True,
+                "confidence_score": fallback_classification.confidence_score,
+                "confidence_label": fallback_classification.confidence_label,
+                "consistency_hash": fallback_classification.consistency_hash,
+                "validation_score": fallback_classification.validation_score
+            }
+        
+        print(f"\n--- COORDINATOR CONSENSUS ANALYSIS ---")
+        coordination_context = {"classifications": valid_classifications}
+        analysis_result = self.coordinator.process(cleaned_text, coordination_context)
+        
+        return analysis_result, agent_performance, len(selected_agents)
+
     def initial_analysis(self, case_text: str, max_retries: int = 2) -> Dict[str, Any]:
+        """Classify ``case_text``; ``"analysis"`` in the response is a dict,
+        left for the HTTP layer to serialize once."""
+        return asyncio.run(run_closing_async_clients(self.initial_analysis_async(case_text, max_retries)))
+
+    async def initial_analysis_async(self, case_text: str, max_retries: int = 2) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        started_at = utc_timestamp()
         try:
-            start_time = time.time()
-            
             print(f"\n" + "=" * 40)
             print(f"   LEGAL CASE ANALYSIS INITIATED")
             print(f"=" * 40)
@@ -1324,7 +2461,7 @@ class EnhancedMultiAgentLegalAnalyzer:
                 return {
                     "status": "error",
                     "error": f"Input validation failed: {'; '.join(input_validation['issues'])}",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": started_at,
                     "system_version": self.SYSTEM_VERSION
                 }
             
@@ -1332,66 +2469,49 @@ class EnhancedMultiAgentLegalAnalyzer:
             
             print(f"\n--- PII REMOVAL PROCESS ---")
             print(f"Processing text through PII remover...")
-            cleaned_text = self.pii_remover.clean_text(case_text)
+            cleaned_text = self.clean_case_text(case_text)
             print(f"PII removal completed")
             print(f"Cleaned text length: {len(cleaned_text)} characters")
             reduction_pct = ((len(case_text) - len(cleaned_text)) / len(case_text)) * 100 if len(case_text) > 0 else 0
             print(f"Text reduction: {reduction_pct:.1f}%")
             print(f"--- AI ANALYSIS USES CLEANED TEXT ONLY ---")
             
-            quality_assessment = self._assess_text_quality(case_text, cleaned_text)
-            
-            valid_classifications = []
-            agent_performance = {}
-            
-            print(f"\n--- SPECIALIST AGENT ANALYSIS ---")
-            print(f"Deploying {len(self.specialist_agents)} specialist agents...")
-            
-            for agent in self.specialist_agents:
-                try:
-                    result = agent.process(cleaned_text)
-                    if isinstance(result, LegalClassification):
-                        valid_classifications.append(result)
-                        agent_performance[agent.agent_id] = {
-                            "status": "success",
-                            "classification": f"{result.category} - {result.subcategory}",
-                            "relevance_score": result.relevance_score,
-                            "processing_time": result.processing_time,
-                            "fallback_used": result.fallback_used,
-                            "confidence_score": result.confidence_score,
-                            "confidence_label": result.confidence_label,
-                            "consistency_hash": result.consistency_hash,
-                            "attempt_number": result.attempt_number,
-                            "validation_score": result.validation_score
-                        }
-                    else:
-                        agent_performance[agent.agent_id] = {"status": "not_relevant"}
-                except Exception as e:
-                    agent_performance[agent.agent_id] = {"status": "error", "error": str(e)}
-            
-            if not valid_classifications:
-                print(f"\nNo specialist matches found, deploying final fallback agent...")
-                fallback_classification = self.final_fallback.process(cleaned_text)
-                valid_classifications.append(fallback_classification)
-                agent_performance[self.final_fallback.agent_id] = {
-                    "status": "final_fallback",
-                    "classification": f"{fallback_classification.category} - {fallback_classification.subcategory}",
-                    "relevance_score": fallback_classification.relevance_score,
-                    "processing_time": fallback_classification.processing_time,
-                    "fallback_used": True,
-                    "confidence_score": fallback_classification.confidence_score,
-                    "confidence_label": fallback_classification.confidence_label,
-                    "consistency_hash": fallback_classification.consistency_hash,
-                    "validation_score": fallback_classification.validation_score
-                }
-            
-            print(f"\n--- COORDINATOR CONSENSUS ANALYSIS ---")
-            coordination_context = {"classifications": valid_classifications}
-            analysis_result = self.coordinator.process(cleaned_text, coordination_context)
-            
-            total_time = time.time() - start_time
+            quality_task = asyncio.create_task(
+                asyncio.to_thread(self._assess_text_quality, case_text, cleaned_text)
+            )
             
-            print_overall_metrics_summary(analysis_result, total_time, len(self.specialist_agents), quality_assessment)
+            cache_namespace = (self.PROMPT_VERSION, self.CATEGORIES_DIGEST)
+            cache_key = (*cache_namespace, text_digest(cleaned_text.strip().lower()))
+            cached = _ANALYSIS_CACHE.get(cache_key)
+            cache_hit = cached is not None
+            if cache_hit:
+                print(f"\nClassification cache hit, skipping agent deployment")
+            else:
+                case_vector = snapshot = None
+                if self.SEMANTIC_CACHE_THRESHOLD is not None:
+                    case_vector = await self._embed_case(cleaned_text)
+                    if case_vector is not None:
+                        snapshot = _SEMANTIC_CACHE.get(cache_namespace, case_vector, self.SEMANTIC_CACHE_THRESHOLD)
+                if snapshot is not None:
+                    print(f"\nSemantic cache hit, skipping agent deployment")
+                    cache_hit = True
+                    cached = self._semantic_cache_result(cleaned_text, snapshot, start_time)
+                else:
+                    cached = await self._run_agents(cleaned_text, get_async_openai_client(self.api_key))
+                    if case_vector is not None:
+                        primary = cached[0].primary_classification
+                        _SEMANTIC_CACHE.set(
+                            cache_namespace, case_vector,
+                            (primary.category, primary.subcategory, primary.confidence_score)
+                        )
+                _ANALYSIS_CACHE.set(cache_key, cached)
+            # The cache keeps its own copy; the response is mutated downstream
+            analysis_result, agent_performance, agents_deployed = copy.deepcopy(cached)
+            quality_assessment = await quality_task
+            
+            total_time = time.perf_counter() - start_time
+            
+            print_overall_metrics_summary(analysis_result, total_time, agents_deployed, quality_assessment)
             
             enhanced_result = {
                 "category": analysis_result.primary_classification.category,
@@ -1406,20 +2526,7 @@ class EnhancedMultiAgentLegalAnalyzer:
                 "fallback_used": analysis_result.primary_classification.fallback_used,
                 
                 "secondary_issues": [
-                    {
-                        "category": sec.category,
-                        "subcategory": sec.subcategory,
-                        "confidence": sec.confidence_label,
-                        "confidence_score": sec.confidence_score,
-                        "confidence_label": sec.confidence_label,
-                        "relevance_score": sec.relevance_score,
-                        "urgency_score": sec.urgency_score,
-                        "reasoning": sec.reasoning,
-                        "fallback_used": sec.fallback_used,
-                        "consistency_hash": sec.consistency_hash,
-                        "validation_score": sec.validation_score
-                    }
-                    for sec in analysis_result.secondary_classifications
+                    sec.as_secondary_issue() for sec in analysis_result.secondary_classifications
                 ],
                 "case_complexity": analysis_result.complexity_level,
                 "requires_multiple_attorneys": analysis_result.requires_multiple_attorneys,
@@ -1458,18 +2565,18 @@ class EnhancedMultiAgentLegalAnalyzer:
             return {
                 "status": "success",
                 "method": "dynamic_confidence_legal_analysis",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": started_at,
                 "original_text": case_text,
                 "cleaned_text": cleaned_text,
                 "pii_removal_applied": True,
                 "pii_reduction_percentage": reduction_pct,
-                "analysis": json.dumps(enhanced_result, ensure_ascii=False),
+                "analysis": enhanced_result,
                 "system_version": self.SYSTEM_VERSION,
                 "prompt_version": self.PROMPT_VERSION,
                 "processing_stats": {
                     "total_time": total_time,
-                    "agents_deployed": len(self.specialist_agents),
-                    "agents_responded": len(valid_classifications),
+                    "agents_deployed": agents_deployed,
+                    "agents_responded": len(analysis_result.agents_consulted),
                     "coordination_time": analysis_result.total_processing_time,
                     "fallback_used": analysis_result.primary_classification.fallback_used,
                     "confidence_consensus": analysis_result.confidence_consensus,
@@ -1479,91 +2586,58 @@ class EnhancedMultiAgentLegalAnalyzer:
                     "accuracy_score": analysis_result.accuracy_score,
                     "consistency_score": analysis_result.consistency_score,
                     "validation_passed": analysis_result.validation_passed,
-                    "pii_removal_applied": True
+                    "pii_removal_applied": True,
+                    "cache_hit": cache_hit,
+                    "response_cache": _RESPONSE_CACHE.stats()
                 }
             }
             
         except Exception as e:
-            try:
-                emergency_classification = self.final_fallback.process(case_text)
-                return {
-                    "status": "success",
-                    "method": "emergency_fallback",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "original_text": case_text,
-                    "analysis": json.dumps({
-                        "category": emergency_classification.category,
-                        "subcategory": emergency_classification.subcategory,
-                        "confidence": emergency_classification.confidence_label,
-                        "confidence_score": emergency_classification.confidence_score,
-                        "reasoning": "Emergency fallback classification",
-                        "case_title": None,
-                        "fallback_used": True,
-                        "method": "emergency_fallback",
-                        "gibberish_detected": False,
-                        "secondary_issues": [],
-                        "case_complexity": "unknown",
-                        "requires_multiple_attorneys": False,
-                        "confidence_consensus": 45,
-                        "consensus_label": get_confidence_label(45),
-                        "accuracy_score": emergency_classification.validation_score,
-                        "consistency_score": 1.0,
-                        "validation_passed": True,
-                        "total_legal_areas": 1,
-                        "agents_consulted": [emergency_classification.agent_id],
-                        "total_processing_time": emergency_classification.processing_time,
-                        "agent_performance": {},
-                        "text_quality": {"quality_acceptable": False},
-                        "input_validation": {"is_valid": True},
-                        "key_details": ["Emergency classification"]
-                    }),
-                    "system_version": self.SYSTEM_VERSION,
-                    "prompt_version": self.PROMPT_VERSION
-                }
-            except Exception as fallback_error:
-                return {
-                    "status": "success",
-                    "method": "ultimate_fallback",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "original_text": case_text,
-                    "analysis": json.dumps({
-                        "category": "Business/Corporate Law",
-                        "subcategory": "Business Disputes",
-                        "confidence": "Medium",
-                        "confidence_score": 45,
-                        "reasoning": "Ultimate fallback classification - manual review recommended",
-                        "case_title": None,
-                        "fallback_used": True,
-                        "method": "ultimate_fallback",
-                        "gibberish_detected": False,
-                        "secondary_issues": [],
-                        "case_complexity": "unknown",
-                        "requires_multiple_attorneys": False,
-                        "confidence_consensus": 50,
-                        "consensus_label": "Medium",
-                        "accuracy_score": 0.6,
-                        "consistency_score": 1.0,
-                        "validation_passed": True,
-                        "total_legal_areas": 1,
-                        "agents_consulted": ["ultimate-fallback"],
-                        "total_processing_time": 0.1,
-                        "agent_performance": {},
-                        "text_quality": {"quality_acceptable": False},
-                        "input_validation": {"is_valid": True},
-                        "key_details": ["Ultimate fallback"]
-                    }),
-                    "system_version": self.SYSTEM_VERSION,
-                    "prompt_version": self.PROMPT_VERSION
-                }
+            return await asyncio.to_thread(self._fallback_analysis_response, case_text, started_at)
+
+    def _fallback_analysis_response(self, case_text: str, timestamp: str = None) -> Dict[str, Any]:
+        timestamp = timestamp or utc_timestamp()
+        try:
+            emergency_classification = self.final_fallback.process(self.clean_case_text(case_text))
+            return {
+                "status": "success",
+                "method": "emergency_fallback",
+                "timestamp": timestamp,
+                "original_text": case_text,
+                "analysis": {
+                    **copy.deepcopy(self.EMERGENCY_ANALYSIS_TEMPLATE),
+                    "category": emergency_classification.category,
+                    "subcategory": emergency_classification.subcategory,
+                    "confidence": emergency_classification.confidence_label,
+                    "confidence_score": emergency_classification.confidence_score,
+                    "accuracy_score": emergency_classification.validation_score,
+                    "agents_consulted": [emergency_classification.agent_id],
+                    "total_processing_time": emergency_classification.processing_time
+                },
+                "system_version": self.SYSTEM_VERSION,
+                "prompt_version": self.PROMPT_VERSION
+            }
+        except Exception:
+            response = copy.deepcopy(self.ULTIMATE_FALLBACK_RESPONSE)
+            response["timestamp"] = timestamp
+            response["original_text"] = case_text
+            return response
 
     def generate_questionnaire_summary(self, form_data: Dict[str, Any], case_summary: str, 
                                      category: str, subcategory: str) -> Dict[str, Any]:
         """
         Fast questionnaire-based summary generation that bypasses the full AI analysis pipeline.
         FIXED: Now returns the EXACT same summary format as the AI method.
+        Like initial_analysis, ``"analysis"`` in the response is a dict.
         """
+        return asyncio.run(run_closing_async_clients(
+            self.generate_questionnaire_summary_async(form_data, case_summary, category, subcategory)
+        ))
+
+    async def generate_questionnaire_summary_async(self, form_data: Dict[str, Any], case_summary: str,
+                                                   category: str, subcategory: str) -> Dict[str, Any]:
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Extract prefilled data
             prefilled_data = form_data.get('prefilled_data', {})
@@ -1572,17 +2646,16 @@ class EnhancedMultiAgentLegalAnalyzer:
             # Clean case summary for processing (basic cleaning only)
             cleaned_summary = case_summary.strip()[:3000]  # Limit length
             
-            # Generate case title quickly using the same method as AI
-            case_title = self._generate_simple_case_title(category, subcategory, cleaned_summary)
-            
-            # FIXED: Generate professional summary in EXACT same format as AI method
-            professional_summary_json = self._generate_questionnaire_summary_with_ai_format(
-                cleaned_summary, form_data, category, subcategory, case_title
+            # Title and professional summary are independent calls; run them side by side
+            case_title, professional_summary_json = await self._questionnaire_title_and_summary(
+                cleaned_summary, form_data, category, subcategory
             )
             
             # CRITICAL: Validate the generated summary has the expected structure
             try:
-                summary_validation = json.loads(professional_summary_json)
+                summary_validation = loads_json(professional_summary_json)
+                summary_validation["title"] = case_title
+                professional_summary_json = dumps_json(summary_validation)
                 if not summary_validation.get("title") or not summary_validation.get("summary"):
                     print("Warning: Generated summary missing title or summary sections")
                     professional_summary_json = self._generate_enhanced_fallback_summary(category, subcategory, case_title, cleaned_summary)
@@ -1592,7 +2665,7 @@ class EnhancedMultiAgentLegalAnalyzer:
                 print("Warning: Generated summary is not valid JSON, using enhanced fallback")
                 professional_summary_json = self._generate_enhanced_fallback_summary(category, subcategory, case_title, cleaned_summary)
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Create analysis result that matches AI method's initial_analysis structure
             questionnaire_analysis = {
@@ -1636,12 +2709,12 @@ class EnhancedMultiAgentLegalAnalyzer:
             return {
                 "status": "success",
                 "method": "questionnaire_guided_classification", 
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_timestamp(),
                 "original_text": case_summary,
                 "cleaned_text": cleaned_summary,
                 "pii_removal_applied": False,  
                 "pii_reduction_percentage": 0,
-                "analysis": json.dumps(questionnaire_analysis, ensure_ascii=False),
+                "analysis": questionnaire_analysis,
                 "summary": professional_summary_json,  # CRITICAL: This JSON string must match AI method format exactly
                 "system_version": self.SYSTEM_VERSION,
                 "prompt_version": self.PROMPT_VERSION,
@@ -1670,44 +2743,21 @@ class EnhancedMultiAgentLegalAnalyzer:
             fallback_summary_json = self._generate_enhanced_fallback_summary(category, subcategory, fallback_title, case_summary)
             
             fallback_analysis = {
+                **copy.deepcopy(self.QUESTIONNAIRE_FALLBACK_ANALYSIS_TEMPLATE),
                 "category": category,
                 "subcategory": subcategory,
-                "confidence": "Medium",
-                "confidence_score": 70,
-                "confidence_label": "Medium",
-                "reasoning": "Questionnaire fallback classification due to processing error",
-                "case_title": fallback_title,
-                "method": "questionnaire_fallback",
-                "gibberish_detected": False,
-                "fallback_used": True,
-                "secondary_issues": [],
-                "case_complexity": "standard",
-                "requires_multiple_attorneys": False,
-                "confidence_consensus": 70,
-                "consensus_label": "Medium",
-                "accuracy_score": 0.7,
-                "consistency_score": 1.0,
-                "validation_passed": True,
-                "total_legal_areas": 1,
-                "agents_consulted": ["questionnaire-fallback"],
-                "total_processing_time": 0.1,
-                "agent_performance": {"questionnaire-fallback": {"status": "fallback", "confidence_score": 70}},
-                "text_quality": {"quality_acceptable": True, "has_legal_context": True},
-                "input_validation": {"is_valid": True},
-                "pii_removal_applied": False,
-                "pii_reduction_percentage": 0,
-                "key_details": ["Questionnaire fallback due to error"]
+                "case_title": fallback_title
             }
             
             return {
                 "status": "success",
                 "method": "questionnaire_fallback",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_timestamp(),
                 "original_text": case_summary,
                 "cleaned_text": case_summary,
                 "pii_removal_applied": False,
                 "pii_reduction_percentage": 0,
-                "analysis": json.dumps(fallback_analysis, ensure_ascii=False),
+                "analysis": fallback_analysis,
                 "summary": fallback_summary_json,  # CRITICAL: Enhanced fallback with proper JSON structure
                 "system_version": self.SYSTEM_VERSION,
                 "prompt_version": self.PROMPT_VERSION,
@@ -1719,6 +2769,17 @@ class EnhancedMultiAgentLegalAnalyzer:
                 }
             }
 
+    async def _questionnaire_title_and_summary(self, cleaned_summary: str, form_data: Dict[str, Any],
+                                               category: str, subcategory: str) -> Tuple[str, str]:
+        """Case title and summary JSON; the summary is written without a title and gets it afterwards."""
+        return await asyncio.gather(
+            asyncio.to_thread(self._generate_simple_case_title, category, subcategory, cleaned_summary),
+            asyncio.to_thread(
+                self._generate_questionnaire_summary_with_ai_format,
+                cleaned_summary, form_data, category, subcategory, None
+            )
+        )
+
     def _generate_simple_case_title(self, category: str, subcategory: str, case_summary: str) -> str:
         """Generate a quick case title without complex AI processing"""
         try:
@@ -1743,26 +2804,28 @@ Response with ONLY the title text:"""
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "Generate concise legal case titles, maximum 70 characters, no PII."},
+                    self.QUESTIONNAIRE_TITLE_SYSTEM_MESSAGE,
                     {"role": "user", "content": title_prompt}
                 ],
-                temperature=0.1,
-                max_tokens=50
+                temperature=0,
+                max_tokens=25
             )
             
             title = response.choices[0].message.content.strip().strip('"').strip("'")
-            return title[:70] if len(title) > 70 else title
+            return self._cap_title(title)
             
         except Exception:
             return f"{subcategory} Legal Matter"
 
     def _generate_questionnaire_summary_with_ai_format(self, cleaned_case_text: str, form_data: Dict[str, Any], 
-                                                      category: str, subcategory: str, case_title: str) -> str:
+                                                      category: str, subcategory: str, case_title: Optional[str]) -> str:
         """
         Generate professional summary using the EXACT same format as the AI method
         FIXED: Now ensures proper JSON string output that matches AI method exactly
         """
         try:
+            form_data_text = dumps_json(form_data)
+            
             # FIXED: Use the exact same prompt structure as the AI method generate_final_summary
             prompt = f"""You are a professional legal summarizer assisting a {category} attorney specializing in {subcategory} cases in reviewing potential client leads.
 
@@ -1778,14 +2841,14 @@ Follow these guidelines:
 {cleaned_case_text}
 
 ### **User-Provided Form Responses:**
-{form_data}
+{self._clip_prompt_text(form_data_text, self.SUMMARY_CONTEXT_CHARS)}
 
 ### **Confidence Assessment:**
 Classification Confidence: 85/100 (High)
 
 CRITICAL: You must return VALID JSON in this EXACT structure:
 {{
-  "title": "{case_title}",
+  "title": "{case_title or ''}",
   "summary": {{
     "General Case Summary": "A comprehensive 3-4 sentence paragraph summarizing the core legal situation without any PII",
     "Key aspects of the case": [
@@ -1818,12 +2881,12 @@ VALIDATION REQUIREMENTS:
 - Professional legal terminology throughout
 - JSON must be perfectly formatted and parseable"""
 
-            summary_seed = abs(hash(str(cleaned_case_text) + str(form_data) + category + subcategory)) % 1000000
+            summary_seed = stable_seed(str(cleaned_case_text), form_data_text + category + subcategory)
 
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are a senior legal document summarizer. You MUST return ONLY valid JSON with the exact nested structure requested. Do not include any text before or after the JSON object."},
+                    self.QUESTIONNAIRE_SUMMARY_SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
                 response_format={"type": "json_object"},  # Force JSON output
@@ -1837,7 +2900,7 @@ VALIDATION REQUIREMENTS:
             # FIXED: Enhanced validation and structure verification
             try:
                 # Parse and validate the JSON structure
-                parsed_json = json.loads(summary_content)
+                parsed_json = loads_json(summary_content)
                 
                 # Validate required structure
                 if not isinstance(parsed_json, dict):
@@ -1890,9 +2953,7 @@ VALIDATION REQUIREMENTS:
         if not case_title:
             case_title = f"{subcategory} Legal Consultation"
         
-        # Ensure title is under 70 characters
-        if len(case_title) > 67:
-            case_title = case_title[:67] + "..."
+        case_title = self._cap_title(case_title)
         
         # Create contextual content based on category and available case text
         case_context = ""
@@ -1926,31 +2987,40 @@ VALIDATION REQUIREMENTS:
             }
         }
         
-        result_json = json.dumps(enhanced_summary, ensure_ascii=False, indent=None)
+        result_json = dumps_json(enhanced_summary)
         print(f"✓ Generated enhanced fallback summary with {len(result_json)} characters")
         return result_json
 
     def _assess_text_quality(self, original: str, cleaned: str) -> Dict[str, Any]:
         try:
             original_words = len(original.split())
-            cleaned_words = len(cleaned.split())
+            if len(cleaned.strip()) <= 15:
+                # Too short to pass regardless of content
+                cleaned_words = len(cleaned.split())
+                return {
+                    **self.TEXT_QUALITY_REJECTED,
+                    "original_words": original_words,
+                    "cleaned_words": cleaned_words,
+                    "reduction_percentage": (
+                        ((original_words - cleaned_words) / original_words) * 100 if original_words else 100
+                    )
+                }
+            
+            cleaned_lower = cleaned.lower()
+            cleaned_tokens = cleaned_lower.split()
+            cleaned_words = len(cleaned_tokens)
             
             if original_words == 0:
                 reduction_pct = 100
             else:
                 reduction_pct = ((original_words - cleaned_words) / original_words) * 100
             
-            legal_indicators = [
-                'medical', 'surgery', 'device', 'business', 'partner', 'customer', 
-                'company', 'contract', 'employer', 'fired', 'accident', 'injury',
-                'property', 'defective', 'product', 'divorce', 'custody', 'arrested',
-                'lawyer', 'attorney', 'court', 'lawsuit', 'doctor', 'hospital',
-                'legal', 'law', 'rights', 'claim', 'damages', 'violation'
-            ]
-            
-            has_legal_context = any(word in cleaned.lower() for word in legal_indicators)
+            has_legal_context = (
+                not _LEGAL_INDICATORS.isdisjoint(cleaned_tokens)
+                or _LEGAL_INDICATOR_RE.search(cleaned_lower) is not None
+            )
             
-            sentence_count = len([s for s in cleaned.split('.') if s.strip()])
+            sentence_count = len(list(filter(str.strip, cleaned.split('.'))))
             avg_sentence_length = cleaned_words / max(sentence_count, 1)
             
             quality_acceptable = (
@@ -1972,23 +3042,14 @@ VALIDATION REQUIREMENTS:
                 "gibberish_detected": not quality_acceptable
             }
         except Exception as e:
-            return {
-                "original_words": 0,
-                "cleaned_words": 0,
-                "reduction_percentage": 100,
-                "has_legal_context": False,
-                "sentence_count": 0,
-                "avg_sentence_length": 0,
-                "quality_acceptable": False,
-                "gibberish_detected": True
-            }
+            return dict(self.TEXT_QUALITY_REJECTED)
 
     def _log_multi_agent_analysis(self, case_text: str, response: Dict[str, Any], 
                                  success: bool, agent_performance: Dict[str, Any]) -> None:
         try:
             case_hash = "unknown"
             try:
-                case_hash = hashlib.sha256(case_text.encode('utf-8', errors='replace')).hexdigest()
+                case_hash = text_digest(case_text).hex()
             except Exception:
                 case_hash = "hash_failed"
             
@@ -1999,7 +3060,7 @@ VALIDATION REQUIREMENTS:
                                       if p.get("confidence_score", 0) >= 80)
             
             log_entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_timestamp(),
                 "system_version": self.SYSTEM_VERSION,
                 "prompt_version": self.PROMPT_VERSION,
                 "case_text_hash": case_hash,
@@ -2020,66 +3081,58 @@ VALIDATION REQUIREMENTS:
         except Exception as e:
             pass
 
-    def generate_final_summary(self, initial_analysis: Dict[str, Any], form_data: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            if initial_analysis.get("status") == "error":
-                return {
-                    "status": "error",
-                    "error": "Cannot generate summary - multi-agent analysis failed",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "system_version": self.SYSTEM_VERSION
-                }
-            
-            if isinstance(initial_analysis.get("analysis"), str):
-                analysis_data = json.loads(initial_analysis.get("analysis", "{}"))
-            else:
-                analysis_data = initial_analysis.get("analysis", {})
-            
-            category = analysis_data.get("category", "Unknown")
-            subcategory = analysis_data.get("subcategory", "Unknown")
-            confidence_score = analysis_data.get("confidence_score", 50)
-            cleaned_case_text = initial_analysis.get("cleaned_text", "No case details available.")
-            
-            case_title = analysis_data.get("case_title")
-            if not case_title or case_title.endswith(" Case"):
-                title_prompt = f"""Generate a specific, descriptive title (MAXIMUM 70 characters) for this {category} - {subcategory} case based on these details:
-                
-                Case details: {cleaned_case_text}
-                Form data: {form_data}
-                
-                The title MUST NOT contain any personally identifiable information (PII) such as names, addresses, specific dates, or unique identifiers.
-                
-                Focus on the legal situation, not the individuals involved.
-                Examples of good titles:
-                - "Interstate Adoption with Biological Parent Consent"
-                - "Workplace Discrimination Based on Religious Practices"  
-                - "Contested Foreclosure with Improper Notice Claims"
-                - "Guardianship Petition for Elderly Parent with Dementia"
-                - "Employment Contract Dispute with Severance Issues"
-                
-                YOUR RESPONSE MUST BE ONLY THE TITLE TEXT, MAXIMUM 70 characters."""
-                
-                case_seed = abs(hash(str(cleaned_case_text) + category + subcategory)) % 1000000
-                
-                title_response = self.client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "You generate concise, specific legal case titles without any PII, maximum 70 characters."},
-                        {"role": "user", "content": title_prompt}
-                    ],
-                    temperature=0.0,
-                    seed=case_seed
-                )
-                
-                case_title = title_response.choices[0].message.content.strip('"').strip()
-                
-                if len(case_title) > 70:
-                    case_title = case_title[:67] + "..."
-            else:
-                if len(case_title) > 70:
-                    case_title = case_title[:67] + "..."
-            
-            prompt = f"""You are a professional legal summarizer assisting a {category} attorney specializing in {subcategory} cases in reviewing potential client leads.
+    @staticmethod
+    def _cap_title(title: str, limit: int = 70) -> str:
+        """Truncate a case title to ``limit`` characters, ellipsis included."""
+        return title if len(title) <= limit else title[:limit - 3] + "..."
+
+    @staticmethod
+    def _clip_prompt_text(text: str, limit: int) -> str:
+        """Cap text interpolated into a prompt at ``limit`` characters."""
+        return text if len(text) <= limit else text[:limit] + "..."
+
+    def summary_inputs(self, initial_analysis: Dict[str, Any]) -> Tuple[Dict[str, Any], str, str, Any, str]:
+        """Analysis dict, category, subcategory, confidence score and cleaned text of ``initial_analysis``."""
+        if isinstance(initial_analysis.get("analysis"), str):
+            analysis_data = loads_json(initial_analysis.get("analysis", "{}"))
+        else:
+            analysis_data = initial_analysis.get("analysis", {})
+        
+        return (
+            analysis_data,
+            analysis_data.get("category", "Unknown"),
+            analysis_data.get("subcategory", "Unknown"),
+            analysis_data.get("confidence_score", 50),
+            initial_analysis.get("cleaned_text", "No case details available.")
+        )
+
+    def final_summary_request(self, analysis_data: Dict[str, Any], category: str, subcategory: str,
+                              confidence_score: Any, cleaned_case_text: str,
+                              form_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[tuple]]:
+        """Chat completion parameters for the JSON case summary.
+
+        Without a usable title on the analysis or in the title cache the model
+        writes the title in the same call; the title cache key is then returned
+        alongside the parameters, otherwise None.
+        """
+        title_cache_key = None
+        case_title = analysis_data.get("case_title")
+        if not case_title or case_title.endswith(" Case"):
+            title_cache_key = (category, subcategory, text_digest(str(cleaned_case_text)))
+            case_title = _TITLE_CACHE.get(title_cache_key)
+            if case_title is not None:
+                title_cache_key = None
+        else:
+            case_title = self._cap_title(case_title)
+        
+        if case_title is not None:
+            title_field = f'"{case_title}"'
+        else:
+            title_field = ('"specific, descriptive case title, MAXIMUM 70 characters, focused on the legal situation '
+                           'and free of PII such as names, addresses, specific dates or unique identifiers"')
+        
+        form_data_text = dumps_json(form_data)
+        prompt = f"""You are a professional legal summarizer assisting a {category} attorney specializing in {subcategory} cases in reviewing potential client leads.
 
 Follow these guidelines:
 1. STRICTLY FORBIDDEN: Do not include or reference the original case description.
@@ -2090,17 +3143,17 @@ Follow these guidelines:
 6. Ensure descriptions are abstract and applicable to similar cases.
 
 ### **PII-Cleaned Case Details:**
-{cleaned_case_text}
+{self._clip_prompt_text(cleaned_case_text, self.SUMMARY_CONTEXT_CHARS)}
 
 ### **User-Provided Form Responses:**
-{form_data}
+{self._clip_prompt_text(form_data_text, self.SUMMARY_CONTEXT_CHARS)}
 
 ### **Confidence Assessment:**
 Classification Confidence: {confidence_score}/100 ({get_confidence_label(confidence_score)})
 
 Now, create a structured case summary:
 {{
-  "title": "{case_title}",
+  "title": {title_field},
   "summary": "summary with sections:
               General Case Summary
                 concise paragraph (3-4 sentences) summarizing core legal situation
@@ -2114,44 +3167,116 @@ Now, create a structured case summary:
               "
 }}"""
 
-            summary_seed = abs(hash(str(cleaned_case_text) + str(form_data) + category + subcategory)) % 1000000
+        summary_seed = stable_seed(str(cleaned_case_text), form_data_text + category + subcategory)
+
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                self.SUMMARY_SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.0,
+            "response_format": {"type": "json_object"},
+            "max_tokens": self.SUMMARY_MAX_TOKENS,
+            "seed": summary_seed
+        }, title_cache_key
+
+    def finish_summary(self, summary: str, subcategory: str, title_cache_key: Optional[tuple]) -> str:
+        """Cap and cache a model-written title; summaries with a known title pass through."""
+        if title_cache_key is None:
+            return summary
+        
+        summary_data = loads_json(summary)
+        case_title = self._cap_title(str(summary_data.get("title") or "").strip('"').strip())
+        if case_title:
+            _TITLE_CACHE.set(title_cache_key, case_title)
+        summary_data["title"] = case_title or f"{subcategory} Legal Consultation"
+        return dumps_json(summary_data)
+
+    async def _agenerate_final_summary(self, async_client: openai.AsyncOpenAI, analysis_data: Dict[str, Any],
+                                       category: str, subcategory: str, confidence_score: Any,
+                                       cleaned_case_text: str, form_data: Dict[str, Any]) -> str:
+        request, title_cache_key = self.final_summary_request(
+            analysis_data, category, subcategory, confidence_score, cleaned_case_text, form_data
+        )
+        stream = await async_client.chat.completions.create(stream=True, **request)
+        summary = await acollect_stream(stream)
+        return self.finish_summary(summary, subcategory, title_cache_key)
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a legal document summarizer. Return valid JSON with title and summary fields."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.0,
-                seed=summary_seed
-            )
+    @staticmethod
+    def summary_response(summary: str, confidence_score: Any) -> Dict[str, Any]:
+        """generate_final_summary response for a finished ``summary`` JSON string."""
+        return {
+            "status": "success",
+            "timestamp": utc_timestamp(),
+            "summary": summary,
+            "confidence_score": confidence_score,
+            "confidence_label": get_confidence_label(confidence_score)
+        }
 
-            summary = response.choices[0].message.content
+    def generate_final_summary(self, initial_analysis: Dict[str, Any], form_data: Dict[str, Any]) -> Dict[str, Any]:
+        return asyncio.run(run_closing_async_clients(self.generate_final_summary_async(initial_analysis, form_data)))
+
+    async def generate_final_summary_async(self, initial_analysis: Dict[str, Any],
+                                           form_data: Dict[str, Any]) -> Dict[str, Any]:
+        analysis_data = {}
+        try:
+            if initial_analysis.get("status") == "error":
+                return {
+                    "status": "error",
+                    "error": "Cannot generate summary - multi-agent analysis failed",
+                    "timestamp": utc_timestamp(),
+                    "system_version": self.SYSTEM_VERSION
+                }
             
-            result = {
-                "status": "success",
-                "timestamp": datetime.utcnow().isoformat(),
-                "summary": summary,
-                "confidence_score": confidence_score,
-                "confidence_label": get_confidence_label(confidence_score)
-            }
+            analysis_data, category, subcategory, confidence_score, cleaned_case_text = self.summary_inputs(
+                initial_analysis
+            )
             
-            return result
+            summary = await self._agenerate_final_summary(
+                get_async_openai_client(self.api_key), analysis_data, category, subcategory,
+                confidence_score, cleaned_case_text, form_data
+            )
+            
+            return self.summary_response(summary, confidence_score)
 
         except Exception as e:
-            try:
-                category = "Legal Matter"
-                subcategory = "General Consultation" 
-                confidence_score = 44
-                
-                if isinstance(initial_analysis.get("analysis"), str):
-                    analysis_data = json.loads(initial_analysis.get("analysis", "{}"))
-                    category = analysis_data.get("category", "Legal Matter")
-                    subcategory = analysis_data.get("subcategory", "General Consultation")
-                    confidence_score = analysis_data.get("confidence_score", 50)
-                
-                fallback_title = f"{subcategory} Legal Consultation"
-                fallback_summary = f"""General Case Summary
+            return self.fallback_summary_response(analysis_data)
+
+    def generate_final_summaries(self, cases: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                                 max_concurrency: int = 10) -> List[Dict[str, Any]]:
+        return asyncio.run(run_closing_async_clients(self.generate_final_summaries_async(cases, max_concurrency)))
+
+    async def generate_final_summaries_async(self, cases: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                                             max_concurrency: int = 10) -> List[Dict[str, Any]]:
+        """
+        Final summaries for many ``(initial_analysis, form_data)`` pairs, in order.
+        At most ``max_concurrency`` summary calls are in flight so a queue of cases
+        stays within the provider's rate limits and the shared connection pool.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(initial_analysis: Dict[str, Any], form_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_final_summary_async(initial_analysis, form_data)
+        
+        return list(await asyncio.gather(
+            *(bounded(initial_analysis, form_data) for initial_analysis, form_data in cases)
+        ))
+
+    def fallback_summary_response(self, analysis_data: Any) -> Dict[str, Any]:
+        """Templated summary for when the summary call or its inputs fail."""
+        try:
+            if not isinstance(analysis_data, dict):
+                analysis_data = {}
+            category = str(analysis_data.get("category", "Legal Matter"))
+            subcategory = str(analysis_data.get("subcategory", "General Consultation"))
+            confidence_score = analysis_data.get("confidence_score", 44 if not analysis_data else 50)
+            if not isinstance(confidence_score, (int, float)):
+                confidence_score = 50
+        
+            fallback_title = f"{subcategory} Legal Consultation"
+            fallback_summary = f"""General Case Summary
 This matter involves a {category.lower()} legal issue in the area of {subcategory.lower()}. The client requires professional legal representation to address their concerns and protect their legal rights. An experienced {category.lower()} attorney should evaluate this matter promptly.
 
 Key aspects of the case
@@ -2172,115 +3297,298 @@ Critical factors
 • Case complexity warrants detailed attorney consultation
 • Early legal intervention could prevent complications"""
 
-                fallback_json = {
-                    "title": fallback_title,
-                    "summary": fallback_summary
-                }
-                
-                return {
-                    "status": "success",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "summary": json.dumps(fallback_json),
-                    "confidence_score": confidence_score,
-                    "confidence_label": get_confidence_label(confidence_score)
-                }
-                
-            except Exception as final_error:
-                emergency_json = {
-                    "title": "Legal Consultation Required",
-                    "summary": "This legal matter requires professional attorney consultation to determine the appropriate course of action."
-                }
-                
-                return {
-                    "status": "success", 
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "summary": json.dumps(emergency_json),
-                    "confidence_score": 36,
-                    "confidence_label": get_confidence_label(36)
-                }
+            fallback_json = {
+                "title": fallback_title,
+                "summary": fallback_summary
+            }
+        
+            return self.summary_response(dumps_json(fallback_json), confidence_score)
+        except Exception:
+            emergency_json = {
+                "title": "Legal Consultation Required",
+                "summary": "This legal matter requires professional attorney consultation to determine the appropriate course of action."
+            }
+            return self.summary_response(dumps_json(emergency_json), 36)
+
+class CaseAnalyzerBatch:
+    """
+    Offline classification of many cases through the OpenAI Batch API.
+    Every case is sent to every specialist in one JSONL upload; results are
+    parsed with the same specialist and coordinator logic as initial_analysis.
+    """
+    
+    COMPLETION_WINDOW = "24h"
+    TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+    
+    def __init__(self, analyzer: EnhancedMultiAgentLegalAnalyzer):
+        self.analyzer = analyzer
+        self.client = analyzer.client
+        self.agents_by_id = {agent.agent_id: agent for agent in analyzer.specialist_agents}
+    
+    def _clean_cases(self, cases: List[str]) -> List[str]:
+        return [self.analyzer.clean_case_text(case_text) for case_text in cases]
+    
+    def submit(self, cases: List[str]) -> str:
+        """Upload one request per (case, specialist) pair and start the batch."""
+        lines = []
+        for case_idx, cleaned_text in enumerate(self._clean_cases(cases)):
+            for agent in self.analyzer.specialist_agents:
+                lines.append(dumps_json({
+                    "custom_id": f"{case_idx}:{agent.agent_id}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._batch_body(agent.enhanced_request(cleaned_text))
+                }))
+        
+        return self._create_batch(lines, "case_batch.jsonl", len(cases))
+    
+    @staticmethod
+    def _batch_body(request: Dict[str, Any]) -> Dict[str, Any]:
+        """``request`` as a Batch API body, with SDK ``extra_body`` fields inlined."""
+        body = {key: value for key, value in request.items() if key != "extra_body"}
+        body.update(request.get("extra_body", {}))
+        return body
+    
+    def _create_batch(self, lines: List[str], file_name: str, case_count: int) -> str:
+        batch_file = self.client.files.create(
+            file=(file_name, "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.COMPLETION_WINDOW,
+            metadata={"system_version": self.analyzer.SYSTEM_VERSION, "case_count": str(case_count)}
+        )
+        return batch.id
+    
+    def _completed_rows(self, batch_id: str, poll_interval: float) -> List[Dict[str, Any]]:
+        """Wait for ``batch_id`` to finish and return its successful output rows."""
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in self.TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch_id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+        
+        rows = []
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            row = loads_json(line)
+            response = row.get("response") or {}
+            if row.get("error") or response.get("status_code") != 200:
+                continue
+            rows.append(row)
+        return rows
+    
+    def poll_and_collect(self, batch_id: str, cases: List[str],
+                         poll_interval: float = 30.0) -> List[CaseAnalysisResult]:
+        """
+        Wait for ``batch_id`` to finish and build one CaseAnalysisResult per case.
+        ``cases`` must be the list passed to ``submit``; cases no specialist
+        accepted are classified by the final fallback agent.
+        """
+        rows = self._completed_rows(batch_id, poll_interval)
+        
+        cleaned_cases = self._clean_cases(cases)
+        case_features = [CaseFeatures.from_text(cleaned_text) for cleaned_text in cleaned_cases]
+        classifications = [[] for _ in cleaned_cases]
+        start_time = time.perf_counter()
+        
+        for row in rows:
+            response = row["response"]
+            case_idx, agent_id = row["custom_id"].split(":", 1)
+            agent = self.agents_by_id.get(agent_id)
+            if agent is None:
+                continue
+            
+            try:
+                result = loads_json(response["body"]["choices"][0]["message"]["content"])
+                case_idx = int(case_idx)
+                classification = agent.build_enhanced_classification(
+                    cleaned_cases[case_idx], result, start_time, case_features[case_idx]
+                )
+            except Exception:
+                continue
+            if classification is not None:
+                classifications[case_idx].append(classification)
+        
+        results = []
+        for cleaned_text, case_classifications in zip(cleaned_cases, classifications):
+            if not case_classifications:
+                case_classifications = [self.analyzer.final_fallback.process(cleaned_text)]
+            results.append(self.analyzer.coordinator.process(
+                cleaned_text, {"classifications": case_classifications}
+            ))
+        return results
+
+class CaseSummaryBatch(CaseAnalyzerBatch):
+    """
+    Offline final summaries for many analyzed cases through the OpenAI Batch API,
+    using the same prompt as generate_final_summary. Cases are
+    ``(initial_analysis, form_data)`` pairs.
+    """
+    
+    def __init__(self, analyzer: EnhancedMultiAgentLegalAnalyzer):
+        super().__init__(analyzer)
+        self.title_cache_keys: Dict[str, Dict[str, Optional[tuple]]] = {}
+    
+    def submit(self, cases: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Optional[str]:
+        """
+        Upload one summary request per successfully analyzed case and start the batch.
+        Returns None, without uploading anything, when no case can be summarized.
+        """
+        lines = []
+        title_cache_keys = {}
+        for case_idx, (initial_analysis, form_data) in enumerate(cases):
+            if initial_analysis.get("status") == "error":
+                continue
+            try:
+                analysis_data, category, subcategory, confidence_score, cleaned_case_text = (
+                    self.analyzer.summary_inputs(initial_analysis)
+                )
+            except Exception:
+                continue
+            request, title_cache_key = self.analyzer.final_summary_request(
+                analysis_data, category, subcategory, confidence_score, cleaned_case_text, form_data
+            )
+            custom_id = str(case_idx)
+            title_cache_keys[custom_id] = title_cache_key
+            lines.append(dumps_json({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": request
+            }))
+        
+        if not lines:
+            return None
+        
+        batch_id = self._create_batch(lines, "summary_batch.jsonl", len(cases))
+        self.title_cache_keys[batch_id] = title_cache_keys
+        return batch_id
+    
+    def poll_and_collect(self, batch_id: Optional[str], cases: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                         poll_interval: float = 30.0) -> List[Dict[str, Any]]:
+        """
+        Wait for ``batch_id`` to finish and return one generate_final_summary-style
+        response per case. ``batch_id`` and ``cases`` must come from ``submit`` on
+        this instance, which recorded how each title was to be finished; cases
+        without a usable batch result get the templated fallback summary.
+        """
+        contents = {}
+        if batch_id is not None:
+            for row in self._completed_rows(batch_id, poll_interval):
+                contents[row["custom_id"]] = row["response"]["body"]["choices"][0]["message"]["content"]
+        title_cache_keys = self.title_cache_keys.pop(batch_id, {})
+        
+        results = []
+        for case_idx, (initial_analysis, form_data) in enumerate(cases):
+            if initial_analysis.get("status") == "error":
+                results.append({
+                    "status": "error",
+                    "error": "Cannot generate summary - multi-agent analysis failed",
+                    "timestamp": utc_timestamp(),
+                    "system_version": self.analyzer.SYSTEM_VERSION
+                })
+                continue
+            
+            analysis_data = {}
+            custom_id = str(case_idx)
+            try:
+                analysis_data, _, subcategory, confidence_score, _ = self.analyzer.summary_inputs(initial_analysis)
+                summary = self.analyzer.finish_summary(
+                    contents[custom_id], subcategory, title_cache_keys.get(custom_id)
+                )
+                results.append(self.analyzer.summary_response(summary, confidence_score))
+            except Exception:
+                results.append(self.analyzer.fallback_summary_response(analysis_data))
+        return results
+
+_SUBCATEGORY_TO_FORM = MappingProxyType({
+    "Adoptions": "Form for Adoptions",
+    "Child Custody & Visitation": "Form for Child Custody & Visitation", 
+    "Child Support": "Form for Child Support",
+    "Divorce": "Form for Divorce",
+    "Guardianship": "Form for Guardianship",
+    "Paternity": "Form for Paternity",
+    "Separations": "Form for Separations",
+    "Spousal Support or Alimony": "Form for Spousal Support or Alimony",
+    "Disabilities": "Form for Disabilities",
+    "Employment Contracts": "Form for Employment Contracts",
+    "Employment Discrimination": "Form for Employment Discrimination",
+    "Pensions and Benefits": "Form for Pensions and Benefits", 
+    "Sexual Harassment": "Form for Sexual Harassment",
+    "Wages and Overtime Pay": "Form for Wages and Overtime Pay",
+    "Workplace Disputes": "Form for Workplace Disputes",
+    "Wrongful Termination": "Form for Wrongful Termination",
+    "General Criminal Defense": "Form for General Criminal Defense",
+    "Environmental Violations": "Form for Environmental Violations",
+    "Drug Crimes": "Form for Drug Crimes",
+    "Drunk Driving/DUI/DWI": "Form for Drunk Driving/DUI/DWI",
+    "Felonies": "Form for Felonies", 
+    "Misdemeanors": "Form for Misdemeanors",
+    "Speeding and Moving Violations": "Form for Speeding and Moving Violations",
+    "White Collar Crime": "Form for White Collar Crime",
+    "Tax Evasion": "Form for Tax Evasion",
+    "Commercial Real Estate": "Form for Commercial Real Estate",
+    "Condominiums and Cooperatives": "Form for Condominiums and Cooperatives",
+    "Construction Disputes": "Form for Construction Disputes",
+    "Foreclosures": "Form for Foreclosures",
+    "Mortgages": "Form for Mortgages",
+    "Purchase and Sale of Residence": "Form for Purchase and Sale of Residence",
+    "Title and Boundary Disputes": "Form for Title and Boundary Disputes",
+    "Breach of Contract": "Form for Breach of Contract",
+    "Corporate Tax": "Form for Corporate Tax",
+    "Business Disputes": "Form for Business Disputes",
+    "Buying and Selling a Business": "Form for Buying and Selling a Business",
+    "Contract Drafting and Review": "Form for Contract Drafting and Review",
+    "Corporations, LLCs, Partnerships, etc.": "Form for Corporations, LLCs, Partnerships, etc.",
+    "Entertainment Law": "Form for Entertainment Law",
+    "Citizenship": "Form for Citizenship",
+    "Deportation": "Form for Deportation", 
+    "Permanent Visas or Green Cards": "Form for Permanent Visas or Green Cards",
+    "Temporary Visas": "Form for Temporary Visas",
+    "Automobile Accidents": "Form for Automobile Accidents",
+    "Dangerous Property or Buildings": "Form for Dangerous Property or Buildings",
+    "Defective Products": "Form for Defective Products",
+    "Medical Malpractice": "Form for Medical Malpractice", 
+    "Personal Injury (General)": "Form for Personal Injury (General)",
+    "Contested Wills or Probate": "Form for Contested Wills or Probate",
+    "Drafting Wills and Trusts": "Form for Drafting Wills and Trusts",
+    "Estate Administration": "Form for Estate Administration",
+    "Estate Planning": "Form for Estate Planning",
+    "Collections": "Form for Collections",
+    "Consumer Bankruptcy": "Form for Consumer Bankruptcy",
+    "Consumer Credit": "Form for Consumer Credit", 
+    "Income Tax": "Form for Income Tax",
+    "Property Tax": "Form for Property Tax",
+    "Education and Schools": "Form for Education and Schools",
+    "Social Security – Disability": "Form for Social Security – Disability",
+    "Social Security – Retirement": "Form for Social Security – Retirement",
+    "Social Security – Dependent Benefits": "Form for Social Security – Dependent Benefits",
+    "Social Security – Survivor Benefits": "Form for Social Security – Survivor Benefits", 
+    "Veterans Benefits": "Form for Veterans Benefits",
+    "General Administrative Law": "Form for General Administrative Law",
+    "Environmental Law": "Form for Environmental Law",
+    "Liquor Licenses": "Form for Liquor Licenses",
+    "Constitutional Law": "Form for Constitutional Law",
+    "Attorney Malpractice": "Form for Attorney Malpractice",
+    "Warranties": "Form for Warranties",
+    "Consumer Protection and Fraud": "Form for Consumer Protection and Fraud",
+    "Copyright": "Form for Copyright",
+    "Patents": "Form for Patents",
+    "Trademarks": "Form for Trademarks",
+    "General Landlord and Tenant Issues": "Form for General Landlord and Tenant Issues"
+})
 
 def create_subcategory_to_form_mapping():
-    return {
-        "Adoptions": "Form for Adoptions",
-        "Child Custody & Visitation": "Form for Child Custody & Visitation", 
-        "Child Support": "Form for Child Support",
-        "Divorce": "Form for Divorce",
-        "Guardianship": "Form for Guardianship",
-        "Paternity": "Form for Paternity",
-        "Separations": "Form for Separations",
-        "Spousal Support or Alimony": "Form for Spousal Support or Alimony",
-        "Disabilities": "Form for Disabilities",
-        "Employment Contracts": "Form for Employment Contracts",
-        "Employment Discrimination": "Form for Employment Discrimination",
-        "Pensions and Benefits": "Form for Pensions and Benefits", 
-        "Sexual Harassment": "Form for Sexual Harassment",
-        "Wages and Overtime Pay": "Form for Wages and Overtime Pay",
-        "Workplace Disputes": "Form for Workplace Disputes",
-        "Wrongful Termination": "Form for Wrongful Termination",
-        "General Criminal Defense": "Form for General Criminal Defense",
-        "Environmental Violations": "Form for Environmental Violations",
-        "Drug Crimes": "Form for Drug Crimes",
-        "Drunk Driving/DUI/DWI": "Form for Drunk Driving/DUI/DWI",
-        "Felonies": "Form for Felonies", 
-        "Misdemeanors": "Form for Misdemeanors",
-        "Speeding and Moving Violations": "Form for Speeding and Moving Violations",
-        "White Collar Crime": "Form for White Collar Crime",
-        "Tax Evasion": "Form for Tax Evasion",
-        "Commercial Real Estate": "Form for Commercial Real Estate",
-        "Condominiums and Cooperatives": "Form for Condominiums and Cooperatives",
-        "Construction Disputes": "Form for Construction Disputes",
-        "Foreclosures": "Form for Foreclosures",
-        "Mortgages": "Form for Mortgages",
-        "Purchase and Sale of Residence": "Form for Purchase and Sale of Residence",
-        "Title and Boundary Disputes": "Form for Title and Boundary Disputes",
-        "Breach of Contract": "Form for Breach of Contract",
-        "Corporate Tax": "Form for Corporate Tax",
-        "Business Disputes": "Form for Business Disputes",
-        "Buying and Selling a Business": "Form for Buying and Selling a Business",
-        "Contract Drafting and Review": "Form for Contract Drafting and Review",
-        "Corporations, LLCs, Partnerships, etc.": "Form for Corporations, LLCs, Partnerships, etc.",
-        "Entertainment Law": "Form for Entertainment Law",
-        "Citizenship": "Form for Citizenship",
-        "Deportation": "Form for Deportation", 
-        "Permanent Visas or Green Cards": "Form for Permanent Visas or Green Cards",
-        "Temporary Visas": "Form for Temporary Visas",
-        "Automobile Accidents": "Form for Automobile Accidents",
-        "Dangerous Property or Buildings": "Form for Dangerous Property or Buildings",
-        "Defective Products": "Form for Defective Products",
-        "Medical Malpractice": "Form for Medical Malpractice", 
-        "Personal Injury (General)": "Form for Personal Injury (General)",
-        "Contested Wills or Probate": "Form for Contested Wills or Probate",
-        "Drafting Wills and Trusts": "Form for Drafting Wills and Trusts",
-        "Estate Administration": "Form for Estate Administration",
-        "Estate Planning": "Form for Estate Planning",
-        "Collections": "Form for Collections",
-        "Consumer Bankruptcy": "Form for Consumer Bankruptcy",
-        "Consumer Credit": "Form for Consumer Credit", 
-        "Income Tax": "Form for Income Tax",
-        "Property Tax": "Form for Property Tax",
-        "Education and Schools": "Form for Education and Schools",
-        "Social Security – Disability": "Form for Social Security – Disability",
-        "Social Security – Retirement": "Form for Social Security – Retirement",
-        "Social Security – Dependent Benefits": "Form for Social Security – Dependent Benefits",
-        "Social Security – Survivor Benefits": "Form for Social Security – Survivor Benefits", 
-        "Veterans Benefits": "Form for Veterans Benefits",
-        "General Administrative Law": "Form for General Administrative Law",
-        "Environmental Law": "Form for Environmental Law",
-        "Liquor Licenses": "Form for Liquor Licenses",
-        "Constitutional Law": "Form for Constitutional Law",
-        "Attorney Malpractice": "Form for Attorney Malpractice",
-        "Defective Products": "Form for Defective Products", 
-        "Warranties": "Form for Warranties",
-        "Consumer Protection and Fraud": "Form for Consumer Protection and Fraud",
-        "Copyright": "Form for Copyright",
-        "Patents": "Form for Patents",
-        "Trademarks": "Form for Trademarks",
-        "General Landlord and Tenant Issues": "Form for General Landlord and Tenant Issues"
-    }
+    return _SUBCATEGORY_TO_FORM
 
 def find_form_by_subcategory(subcategory, forms_data):
-    mapping = create_subcategory_to_form_mapping()
-    target_title = mapping.get(subcategory)
+    target_title = _SUBCATEGORY_TO_FORM.get(subcategory)
     
     if target_title:
         for form_id, form_data in forms_data.items():
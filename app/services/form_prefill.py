@@ -1,15 +1,16 @@
 from typing import Dict, Any, List
-import openai
 import json
 import os
 import html
 import unicodedata
 
+from app.services.case_analyzer import get_openai_client
+
 class FormPrefillerService:
     """Service for pre-filling legal forms based on case analysis - ENCODING SAFE"""
 
     def __init__(self, api_key: str):
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         # Path to forms data in the new data directory
         forms_path = os.path.join(os.path.dirname(__file__), "..", "data", "legalForms.json")
         self.forms_data = self._load_forms_data(forms_path)
@@ -77,6 +77,14 @@ class PIIRemover:
         ]
     }
     
+    PRESERVE_TERM_SET = frozenset(term for terms in PRESERVE_TERMS.values() for term in terms)
+    
+    NAME_CONTEXT_INDICATORS = (
+        'attorney', 'lawyer', 'judge', 'court', 'dr.', 'doctor',
+        'hospital', 'clinic', 'company', 'corporation', 'inc',
+        'vs.', 'v.', 'plaintiff', 'defendant', 'witness'
+    )
+    
     COMPANY_SUFFIXES = [
         'inc', 'incorporated', 'llc', 'corp', 'corporation', 'ltd', 'limited',
         'co', 'company', 'group', 'associates', 'partners', 'partnership',
@@ -96,73 +104,75 @@ class PIIRemover:
         'surgeon', 'physician', 'therapist', 'dentist', 'pharmacist'
     ]
     
+    PHONE_PATTERNS = (
+        re.compile(r'\b(?:\+\d{1,2}\s?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b'),
+        re.compile(r'\b\d{3}[\s.-]?\d{3}[\s.-]?\d{4}\b'),
+        re.compile(r'\b\(\d{3}\)\s?\d{3}[\s.-]?\d{4}\b'),
+        re.compile(r'\b\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,9}\b')
+    )
+    
+    EMAIL_PATTERN = re.compile(
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+        re.IGNORECASE
+    )
+    
+    SSN_PATTERNS = (
+        re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
+        re.compile(r'\b\d{3}\s\d{2}\s\d{4}\b')
+    )
+    
+    ADDRESS_PATTERNS = (
+        re.compile(
+            r'\b\d+\s+[A-Z][a-z]+(?: [A-Z][a-z]+)?\s+'
+            r'(?:Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Boulevard|Blvd\.?|'
+            r'Lane|Ln\.?|Drive|Dr\.?|Way|Place|Pl\.?|Court|Ct\.?|'
+            r'Circle|Cir\.?|Parkway|Pkwy\.?)\b',
+            re.IGNORECASE
+        ),
+    )
+    
+    CREDIT_CARD_PATTERNS = (
+        re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'),
+    )
+    
+    DATE_PATTERNS = (
+        re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
+        re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b', re.IGNORECASE)
+    )
+    
+    CASE_NUMBER_PATTERN = re.compile(r'\bCase\s+No\.?\s*\d+[-/]\d+\b', re.IGNORECASE)
+    BAR_NUMBER_PATTERN = re.compile(r'\bBar\s+No\.?\s*\d+\b', re.IGNORECASE)
+    POLICY_NUMBER_PATTERN = re.compile(r'\bPolicy\s+No\.?\s*[A-Z0-9-]+\b', re.IGNORECASE)
+    DOCKET_NUMBER_PATTERN = re.compile(r'\bDocket\s+No\.?\s*\d+[-/]\d+\b', re.IGNORECASE)
+    
+    ACCOUNT_PATTERNS = (
+        re.compile(r'\bAccount\s+(?:No\.?|Number)\s*[A-Z0-9-]+\b', re.IGNORECASE),
+        re.compile(r'\b\d{10,}\b')
+    )
+    
+    NAME_PATTERN = re.compile(
+        r'\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]*\.?)?\s+)?[A-Z][a-z]+\b'
+    )
+    
+    ZIP_PATTERNS = (
+        re.compile(r'\b\d{5}(?:-\d{4})?\b'),
+    )
+    
+    RESIDUAL_PII_PATTERNS = (
+        (re.compile(r'\b\d{3}-\d{2}-\d{4}\b'), 'SSN'),
+        (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), 'Email'),
+        (re.compile(r'\b\d{3}[\s.-]?\d{3}[\s.-]?\d{4}\b'), 'Phone'),
+        (re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'), 'Credit Card')
+    )
+    
     def __init__(self, sensitivity_level: PIISensitivityLevel = PIISensitivityLevel.LOW):
         self.sensitivity_level = sensitivity_level
         self.logger = logging.getLogger(__name__)
-        self._compile_patterns()
-    
-    def _compile_patterns(self):
-        self.phone_patterns = [
-            re.compile(r'\b(?:\+\d{1,2}\s?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b'),
-            re.compile(r'\b\d{3}[\s.-]?\d{3}[\s.-]?\d{4}\b'),
-            re.compile(r'\b\(\d{3}\)\s?\d{3}[\s.-]?\d{4}\b'),
-            re.compile(r'\b\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,9}\b')
-        ]
-        
-        self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            re.IGNORECASE
-        )
-        
-        self.ssn_patterns = [
-            re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
-            re.compile(r'\b\d{3}\s\d{2}\s\d{4}\b')
-        ]
-        
-        self.address_patterns = [
-            re.compile(
-                r'\b\d+\s+[A-Z][a-z]+(?: [A-Z][a-z]+)?\s+'
-                r'(?:Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Boulevard|Blvd\.?|'
-                r'Lane|Ln\.?|Drive|Dr\.?|Way|Place|Pl\.?|Court|Ct\.?|'
-                r'Circle|Cir\.?|Parkway|Pkwy\.?)\b',
-                re.IGNORECASE
-            )
-        ]
-        
-        self.credit_card_patterns = [
-            re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b')
-        ]
-        
-        self.date_patterns = [
-            re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
-            re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b', re.IGNORECASE)
-        ]
-        
-        self.case_number_pattern = re.compile(r'\bCase\s+No\.?\s*\d+[-/]\d+\b', re.IGNORECASE)
-        self.bar_number_pattern = re.compile(r'\bBar\s+No\.?\s*\d+\b', re.IGNORECASE)
-        self.policy_number_pattern = re.compile(r'\bPolicy\s+No\.?\s*[A-Z0-9-]+\b', re.IGNORECASE)
-        self.docket_number_pattern = re.compile(r'\bDocket\s+No\.?\s*\d+[-/]\d+\b', re.IGNORECASE)
-        
-        self.account_patterns = [
-            re.compile(r'\bAccount\s+(?:No\.?|Number)\s*[A-Z0-9-]+\b', re.IGNORECASE),
-            re.compile(r'\b\d{10,}\b')
-        ]
-        
-        self.name_pattern = re.compile(
-            r'\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]*\.?)?\s+)?[A-Z][a-z]+\b'
-        )
-        
-        self.zip_patterns = [
-            re.compile(r'\b\d{5}(?:-\d{4})?\b')
-        ]
     
     @classmethod
     def _is_preserve_term(cls, word: str) -> bool:
         word_lower = word.lower().strip('.,!?()[]{}";:')
-        for category in cls.PRESERVE_TERMS.values():
-            if word_lower in category:
-                return True
-        return False
+        return word_lower in cls.PRESERVE_TERM_SET
     
     @classmethod
     def _is_company_or_title(cls, text: str) -> bool:
@@ -179,6 +189,10 @@ class PIIRemover:
         return False
     
     def _should_preserve_name(self, name: str, context_before: str = "", context_after: str = "") -> bool:
+        # LOW keeps every name, so skip the per-match term and context scans
+        if self.sensitivity_level == PIISensitivityLevel.LOW:
+            return True
+        
         words = name.split()
         if any(self._is_preserve_term(word) for word in words):
             return True
@@ -187,21 +201,12 @@ class PIIRemover:
             return True
         
         context = (context_before + " " + context_after).lower()
-        legal_indicators = [
-            'attorney', 'lawyer', 'judge', 'court', 'dr.', 'doctor',
-            'hospital', 'clinic', 'company', 'corporation', 'inc',
-            'vs.', 'v.', 'plaintiff', 'defendant', 'witness'
-        ]
-        
-        if any(indicator in context for indicator in legal_indicators):
+        if any(indicator in context for indicator in self.NAME_CONTEXT_INDICATORS):
             return True
         
         if context_before.strip().endswith('.'):
             return True
         
-        if self.sensitivity_level == PIISensitivityLevel.LOW:
-            return True
-        
         return False
     
     def _should_preserve_date(self, date: str, context: str = "") -> bool:
@@ -226,6 +231,15 @@ class PIIRemover:
         
         return False
     
+    @staticmethod
+    def _redact(pattern: re.Pattern, text: str, label: str, placeholder: str, pii_found: List[str]) -> str:
+        """Replace every ``pattern`` match with ``placeholder`` in one pass,
+        recording each match in ``pii_found``."""
+        def replace(match):
+            pii_found.append(f"{label}:{match.group(0)}")
+            return placeholder
+        return pattern.sub(replace, text)
+    
     def clean_text(self, text: str) -> PIIRemovalResult:
         try:
             original_text = text
@@ -235,41 +249,26 @@ class PIIRemover:
             warnings = []
             
             # Remove phone numbers
-            for pattern in self.phone_patterns:
-                matches = pattern.findall(cleaned_text)
-                if matches:
-                    pii_found.extend([f"phone:{match}" for match in matches])
-                    cleaned_text = pattern.sub('[PHONE]', cleaned_text)
+            for pattern in self.PHONE_PATTERNS:
+                cleaned_text = self._redact(pattern, cleaned_text, "phone", '[PHONE]', pii_found)
             
             # Remove email addresses
-            email_matches = self.email_pattern.findall(cleaned_text)
-            if email_matches:
-                pii_found.extend([f"email:{match}" for match in email_matches])
-                cleaned_text = self.email_pattern.sub('[EMAIL]', cleaned_text)
+            cleaned_text = self._redact(self.EMAIL_PATTERN, cleaned_text, "email", '[EMAIL]', pii_found)
             
             # Remove SSN
-            for pattern in self.ssn_patterns:
-                matches = pattern.findall(cleaned_text)
-                if matches:
-                    pii_found.extend([f"ssn:{match}" for match in matches])
-                    cleaned_text = pattern.sub('[SSN]', cleaned_text)
+            for pattern in self.SSN_PATTERNS:
+                cleaned_text = self._redact(pattern, cleaned_text, "ssn", '[SSN]', pii_found)
             
             # Remove credit card numbers
-            for pattern in self.credit_card_patterns:
-                matches = pattern.findall(cleaned_text)
-                if matches:
-                    pii_found.extend([f"credit_card:{match}" for match in matches])
-                    cleaned_text = pattern.sub('[CREDIT_CARD]', cleaned_text)
+            for pattern in self.CREDIT_CARD_PATTERNS:
+                cleaned_text = self._redact(pattern, cleaned_text, "credit_card", '[CREDIT_CARD]', pii_found)
             
             # Remove addresses
-            for pattern in self.address_patterns:
-                matches = pattern.findall(cleaned_text)
-                if matches:
-                    pii_found.extend([f"address:{match}" for match in matches])
-                    cleaned_text = pattern.sub('[ADDRESS]', cleaned_text)
+            for pattern in self.ADDRESS_PATTERNS:
+                cleaned_text = self._redact(pattern, cleaned_text, "address", '[ADDRESS]', pii_found)
             
             # Remove ZIP codes (preserve if in legal context)
-            for pattern in self.zip_patterns:
+            for pattern in self.ZIP_PATTERNS:
                 def replace_zip(match):
                     zip_code = match.group(0)
                     start, end = match.span()
@@ -283,28 +282,13 @@ class PIIRemover:
                 cleaned_text = pattern.sub(replace_zip, cleaned_text)
             
             # Legal-specific removals
-            case_matches = self.case_number_pattern.findall(cleaned_text)
-            if case_matches:
-                pii_found.extend([f"case_number:{match}" for match in case_matches])
-                cleaned_text = self.case_number_pattern.sub('[CASE_NUMBER]', cleaned_text)
-            
-            bar_matches = self.bar_number_pattern.findall(cleaned_text)
-            if bar_matches:
-                pii_found.extend([f"bar_number:{match}" for match in bar_matches])
-                cleaned_text = self.bar_number_pattern.sub('[BAR_NUMBER]', cleaned_text)
-            
-            policy_matches = self.policy_number_pattern.findall(cleaned_text)
-            if policy_matches:
-                pii_found.extend([f"policy_number:{match}" for match in policy_matches])
-                cleaned_text = self.policy_number_pattern.sub('[POLICY_NUMBER]', cleaned_text)
-            
-            docket_matches = self.docket_number_pattern.findall(cleaned_text)
-            if docket_matches:
-                pii_found.extend([f"docket_number:{match}" for match in docket_matches])
-                cleaned_text = self.docket_number_pattern.sub('[DOCKET_NUMBER]', cleaned_text)
+            cleaned_text = self._redact(self.CASE_NUMBER_PATTERN, cleaned_text, "case_number", '[CASE_NUMBER]', pii_found)
+            cleaned_text = self._redact(self.BAR_NUMBER_PATTERN, cleaned_text, "bar_number", '[BAR_NUMBER]', pii_found)
+            cleaned_text = self._redact(self.POLICY_NUMBER_PATTERN, cleaned_text, "policy_number", '[POLICY_NUMBER]', pii_found)
+            cleaned_text = self._redact(self.DOCKET_NUMBER_PATTERN, cleaned_text, "docket_number", '[DOCKET_NUMBER]', pii_found)
             
             # Account numbers (preserve short reference numbers)
-            for pattern in self.account_patterns:
+            for pattern in self.ACCOUNT_PATTERNS:
                 def replace_account(match):
                     account = match.group(0)
                     if len(account.replace(' ', '').replace('-', '')) < 8:
@@ -332,11 +316,11 @@ class PIIRemover:
                 pii_found.append(f"name:{name}")
                 return '[NAME]'
             
-            cleaned_text = self.name_pattern.sub(replace_names, cleaned_text)
+            cleaned_text = self.NAME_PATTERN.sub(replace_names, cleaned_text)
             
             # Smart date removal (only for birthdate-like contexts in MEDIUM/HIGH sensitivity)
             if self.sensitivity_level != PIISensitivityLevel.LOW:
-                for pattern in self.date_patterns:
+                for pattern in self.DATE_PATTERNS:
                     def replace_date(match):
                         date = match.group(0)
                         start, end = match.span()
@@ -361,11 +345,11 @@ class PIIRemover:
             if len(pii_found) > 10:
                 warnings.append(f"Large amount of PII detected: {len(pii_found)} items")
             
-            preserved_legal_terms = [term for term in preserved_terms if any(
-                category_term in term.lower() 
-                for category in self.PRESERVE_TERMS.values() 
-                for category_term in category
-            )]
+            preserved_legal_terms = any(
+                category_term in term.lower()
+                for term in preserved_terms
+                for category_term in self.PRESERVE_TERM_SET
+            )
             
             if not preserved_legal_terms and 'legal' in original_text.lower():
                 warnings.append("No legal context terms preserved - verify text quality")
@@ -427,15 +411,8 @@ class PIIRemover:
             "score": 100
         }
         
-        potential_pii_patterns = [
-            (r'\b\d{3}-\d{2}-\d{4}\b', 'SSN'),
-            (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', 'Email'),
-            (r'\b\d{3}[\s.-]?\d{3}[\s.-]?\d{4}\b', 'Phone'),
-            (r'\b(?:\d{4}[-\s]?){3}\d{4}\b', 'Credit Card')
-        ]
-        
-        for pattern, pii_type in potential_pii_patterns:
-            if re.search(pattern, cleaned):
+        for pattern, pii_type in self.RESIDUAL_PII_PATTERNS:
+            if pattern.search(cleaned):
                 validation_results["issues"].append(f"Potential {pii_type} found in cleaned text")
                 validation_results["pii_likely_removed"] = False
                 validation_results["score"] -= 20
@@ -82,6 +82,8 @@ def create_app(config_object=None):
     try:
         openai.api_key = os.getenv('OPENAI_API_KEY')
         app.config['OPENAI_CLIENT'] = openai
+        from app.services.case_analyzer import configure_rate_limit
+        configure_rate_limit(app.config.get('OPENAI_RPM_LIMIT', 0), app.config.get('OPENAI_TPM_LIMIT', 0))
         app.logger.info("✅ OpenAI API initialized successfully")
     except Exception as e:
         app.logger.error(f"❌ Failed to initialize OpenAI API: {str(e)}")
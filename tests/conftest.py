@@ -0,0 +1,12 @@
+import os
+import sys
+
+# Same import paths as main.py, so modules resolve top-level imports like
+# legal_specialist_config
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.extend([
+    BASE_DIR,
+    os.path.join(BASE_DIR, 'app'),
+    os.path.join(BASE_DIR, 'app/services'),
+    os.path.join(BASE_DIR, 'app/utils')
+])
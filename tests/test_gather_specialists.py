@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+from app.services.case_analyzer import gather_specialists
+
+
+class StubAgent:
+    """Agent whose ``aprocess`` returns ``result`` after ``delay`` seconds,
+    setting the shared cancel event first when ``confirms`` is true."""
+
+    def __init__(self, agent_id, delay, result=None, confirms=False, error=None):
+        self.agent_id = agent_id
+        self.delay = delay
+        self.result = result if result is not None else agent_id
+        self.confirms = confirms
+        self.error = error
+        self.finished = False
+
+    async def aprocess(self, case_text, context=None):
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        if self.confirms:
+            context["cancel_event"].set()
+        self.finished = True
+        return self.result
+
+
+def test_returns_outcomes_in_agent_order():
+    agents = [StubAgent("slow", 0.05), StubAgent("fast", 0.0)]
+
+    outcomes = asyncio.run(gather_specialists(agents, "case text", {}))
+
+    assert outcomes == [(agents[0], "slow"), (agents[1], "fast")]
+
+
+def test_exceptions_are_returned_as_outcomes():
+    error = ValueError("bad response")
+    agents = [StubAgent("broken", 0.0, error=error), StubAgent("ok", 0.01)]
+
+    outcomes = asyncio.run(gather_specialists(agents, "case text", {}))
+
+    assert outcomes[0] == (agents[0], error)
+    assert outcomes[1] == (agents[1], "ok")
+
+
+def test_cancel_event_cancels_agents_still_running():
+    context = {"cancel_event": threading.Event()}
+    confirming = StubAgent("confirming", 0.0, confirms=True)
+    finished = StubAgent("finished", 0.0)
+    straggler = StubAgent("straggler", 10.0)
+
+    outcomes = asyncio.run(gather_specialists([confirming, finished, straggler], "case text", context))
+
+    assert outcomes[0] == (confirming, "confirming")
+    assert outcomes[1] == (finished, "finished")
+    assert outcomes[2][0] is straggler
+    assert isinstance(outcomes[2][1], asyncio.CancelledError)
+    assert not straggler.finished
+
+
+def test_without_cancel_event_every_agent_finishes():
+    agents = [StubAgent("first", 0.0, confirms=False), StubAgent("second", 0.02)]
+
+    outcomes = asyncio.run(gather_specialists(agents, "case text"))
+
+    assert [outcome for _, outcome in outcomes] == ["first", "second"]
+    assert all(agent.finished for agent in agents)
@@ -0,0 +1,13 @@
+from app.services.case_analyzer import EnhancedMultiAgentLegalAnalyzer, _LEGAL_CATEGORIES
+
+
+def test_every_category_lists_subcategory_names():
+    for category, subcategories in _LEGAL_CATEGORIES.items():
+        assert isinstance(subcategories, tuple), category
+        assert subcategories, category
+        assert all(isinstance(subcategory, str) and len(subcategory) > 1 for subcategory in subcategories), category
+
+
+def test_single_subcategory_category_is_not_split_into_characters():
+    assert _LEGAL_CATEGORIES["Landlord/Tenant Law"] == ("General Landlord and Tenant Issues",)
+    assert "General Landlord and Tenant Issues" in EnhancedMultiAgentLegalAnalyzer.FORMATTED_SUBCATEGORIES
@@ -0,0 +1,47 @@
+import re
+
+from app.utils.pii_remover import PIIRemover
+
+
+def test_redact_replaces_every_match_and_records_it():
+    pii_found = []
+
+    cleaned = PIIRemover._redact(
+        PIIRemover.EMAIL_PATTERN,
+        "Write to jane.doe@example.com or legal@firm.org today.",
+        "email", "[EMAIL]", pii_found
+    )
+
+    assert cleaned == "Write to [EMAIL] or [EMAIL] today."
+    assert pii_found == ["email:jane.doe@example.com", "email:legal@firm.org"]
+
+
+def test_redact_without_matches_returns_text_unchanged():
+    pii_found = ["phone:555-123-4567"]
+    text = "My landlord kept the security deposit."
+
+    assert PIIRemover._redact(PIIRemover.EMAIL_PATTERN, text, "email", "[EMAIL]", pii_found) == text
+    assert pii_found == ["phone:555-123-4567"]
+
+
+def test_redact_is_a_single_pass():
+    # A placeholder that the pattern itself matches must not be replaced again
+    pii_found = []
+
+    cleaned = PIIRemover._redact(re.compile(r"\[?X+\]?"), "X and XX", "x", "[X]", pii_found)
+
+    assert cleaned == "[X] and [X]"
+    assert pii_found == ["x:X", "x:XX"]
+
+
+def test_clean_text_labels_each_kind_of_pii():
+    result = PIIRemover().clean_text(
+        "Call me at 555-123-4567, email jane.doe@example.com, SSN 123-45-6789."
+    )
+
+    assert result.cleaned_text == "Call me at [PHONE], email [EMAIL], SSN [SSN]."
+    assert result.pii_found == [
+        "phone:555-123-4567",
+        "email:jane.doe@example.com",
+        "ssn:123-45-6789"
+    ]
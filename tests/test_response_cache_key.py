@@ -0,0 +1,36 @@
+from app.services.case_analyzer import response_cache_key
+
+REQUEST = {
+    "model": "gpt-4o-mini",
+    "messages": [{"role": "user", "content": "Classify this case."}],
+    "temperature": 0.1,
+    "max_tokens": 400,
+    "response_format": {"type": "json_object"},
+    "seed": 7,
+    "extra_body": {"prompt_cache_key": "abc"}
+}
+
+
+def test_output_shaping_fields_change_the_key():
+    key = response_cache_key(REQUEST)
+
+    for field, value in (
+        ("messages", [{"role": "user", "content": "Classify this other case."}]),
+        ("temperature", 0.7),
+        ("max_tokens", 800),
+        ("response_format", {"type": "json_schema", "json_schema": {"name": "analysis"}}),
+    ):
+        assert response_cache_key({**REQUEST, field: value}) != key, field
+
+
+def test_seed_and_routing_fields_do_not_change_the_key():
+    key = response_cache_key(REQUEST)
+
+    assert response_cache_key({**REQUEST, "seed": 8}) == key
+    assert response_cache_key({**REQUEST, "extra_body": {"prompt_cache_key": "def"}}) == key
+    assert response_cache_key({k: v for k, v in REQUEST.items() if k != "extra_body"}) == key
+
+
+def test_model_is_part_of_the_key():
+    assert response_cache_key({**REQUEST, "model": "gpt-4o"})[0] == "gpt-4o"
+    assert response_cache_key({**REQUEST, "model": "gpt-4o"}) != response_cache_key(REQUEST)
@@ -0,0 +1,51 @@
+import math
+
+from app.services.case_analyzer import SemanticCache
+
+
+def unit(*components):
+    norm = math.sqrt(sum(c * c for c in components))
+    return [c / norm for c in components]
+
+
+def test_hit_at_or_above_threshold():
+    cache = SemanticCache()
+    cache.set("model", unit(1, 0), "divorce")
+
+    assert cache.get("model", unit(1, 0), threshold=1.0 - 1e-9) == "divorce"
+    assert cache.get("model", unit(1, 0.1), threshold=0.99) == "divorce"
+
+
+def test_miss_below_threshold():
+    cache = SemanticCache()
+    cache.set("model", unit(1, 0), "divorce")
+
+    # cosine similarity of these vectors is about 0.707
+    assert cache.get("model", unit(1, 1), threshold=0.9) is None
+
+
+def test_most_similar_entry_wins():
+    cache = SemanticCache()
+    cache.set("model", unit(1, 0.5), "custody")
+    cache.set("model", unit(1, 0.05), "divorce")
+
+    assert cache.get("model", unit(1, 0), threshold=0.8) == "divorce"
+
+
+def test_entries_are_scoped_by_namespace():
+    cache = SemanticCache()
+    cache.set("model-a", unit(1, 0), "divorce")
+
+    assert cache.get("model-b", unit(1, 0), threshold=0.5) is None
+
+
+def test_oldest_entry_is_evicted_at_maxsize():
+    cache = SemanticCache(maxsize=2)
+    cache.set("model", unit(1, 0, 0), "first")
+    cache.set("model", unit(0, 1, 0), "second")
+    cache.set("model", unit(0, 0, 1), "third")
+
+    assert len(cache) == 2
+    assert cache.get("model", unit(1, 0, 0), threshold=0.9) is None
+    assert cache.get("model", unit(0, 1, 0), threshold=0.9) == "second"
+    assert cache.get("model", unit(0, 0, 1), threshold=0.9) == "third"
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from app.services.case_analyzer import (
+    _IS_RELEVANT_SCAN_LIMIT,
+    _NOT_RELEVANT_CONTENT,
+    acollect_stream,
+    collect_stream,
+)
+
+
+def chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class StubStream:
+    """Chat completion stream over text deltas that records how far it was read."""
+
+    def __init__(self, deltas):
+        self.events = [chunk(delta) for delta in deltas]
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for event in self.events:
+            if self.closed:
+                return
+            self.consumed += 1
+            yield event
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncStubStream(StubStream):
+    async def __aiter__(self):
+        for event in self.events:
+            if self.closed:
+                return
+            self.consumed += 1
+            yield event
+
+    async def close(self):
+        self.closed = True
+
+
+IRRELEVANT_DELTAS = ['{"is_', 'relevant": ', 'false', ', "reasoning": "', 'not a family matter', '"}']
+RELEVANT_DELTAS = ['{"is_relevant": ', 'true', ', "reasoning": "', 'custody dispute', '"}']
+
+
+def test_stops_once_response_is_not_relevant():
+    stream = StubStream(IRRELEVANT_DELTAS)
+
+    assert collect_stream(stream, stop_if_irrelevant=True) == _NOT_RELEVANT_CONTENT
+    assert stream.closed
+    assert stream.consumed == 3
+
+
+def test_relevant_response_is_read_to_the_end():
+    stream = StubStream(RELEVANT_DELTAS)
+
+    assert collect_stream(stream, stop_if_irrelevant=True) == "".join(RELEVANT_DELTAS)
+    assert not stream.closed
+    assert stream.consumed == len(RELEVANT_DELTAS)
+
+
+def test_not_relevant_response_is_read_in_full_without_short_circuit():
+    stream = StubStream(IRRELEVANT_DELTAS)
+
+    assert collect_stream(stream) == "".join(IRRELEVANT_DELTAS)
+    assert not stream.closed
+
+
+def test_late_is_relevant_field_is_ignored():
+    deltas = ['{"reasoning": "' + "x" * _IS_RELEVANT_SCAN_LIMIT + '", ', '"is_relevant": false}']
+    stream = StubStream(deltas)
+
+    assert collect_stream(stream, stop_if_irrelevant=True) == "".join(deltas)
+    assert not stream.closed
+
+
+def test_cancel_event_closes_stream():
+    cancel_event = threading.Event()
+    cancel_event.set()
+    stream = StubStream(RELEVANT_DELTAS)
+
+    assert collect_stream(stream, cancel_event=cancel_event, stop_if_irrelevant=True) is None
+    assert stream.closed
+
+
+def test_async_stops_once_response_is_not_relevant():
+    stream = AsyncStubStream(IRRELEVANT_DELTAS)
+
+    assert asyncio.run(acollect_stream(stream, stop_if_irrelevant=True)) == _NOT_RELEVANT_CONTENT
+    assert stream.closed
+    assert stream.consumed == 3
+
+
+def test_async_relevant_response_is_read_to_the_end():
+    stream = AsyncStubStream(RELEVANT_DELTAS)
+
+    assert asyncio.run(acollect_stream(stream, stop_if_irrelevant=True)) == "".join(RELEVANT_DELTAS)
+    assert not stream.closed
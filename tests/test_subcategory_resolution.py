@@ -0,0 +1,60 @@
+import pytest
+
+from app.services.case_analyzer import (
+    EnhancedLegalSpecialistAgent,
+    EnhancedMultiAgentLegalAnalyzer,
+    _SPECIALIST_SPECS,
+)
+
+
+@pytest.fixture
+def family_law_agent():
+    for agent_id, area, keywords, subcategories, case_examples, legal_concepts in _SPECIALIST_SPECS:
+        if area == "Family Law":
+            return EnhancedLegalSpecialistAgent(
+                agent_id=agent_id,
+                client=None,
+                legal_area=area,
+                keywords=keywords,
+                subcategories=subcategories,
+                case_descriptions=case_examples,
+                legal_concepts=legal_concepts,
+                legal_categories=EnhancedMultiAgentLegalAnalyzer.LEGAL_CATEGORIES
+            )
+    pytest.fail("No Family Law specialist configured")
+
+
+def test_index_selects_subcategory(family_law_agent):
+    index = family_law_agent.subcategories.index("Divorce")
+
+    assert family_law_agent._resolve_subcategory({"subcategory_index": index}) == "Divorce"
+
+
+@pytest.mark.parametrize("index", [-1, 99, True, "3", None])
+def test_invalid_index_falls_back_to_name(family_law_agent, index):
+    result = {"subcategory_index": index, "subcategory": "Paternity"}
+
+    assert family_law_agent._resolve_subcategory(result) == "Paternity"
+
+
+def test_close_name_matches_with_difflib(family_law_agent):
+    result = {"subcategory": "Child Custody and Visitation"}
+
+    assert family_law_agent._resolve_subcategory(result) == "Child Custody & Visitation"
+
+
+def test_partial_name_matches_by_substring(family_law_agent):
+    assert family_law_agent._resolve_subcategory({"subcategory": "Alimony"}) == "Spousal Support or Alimony"
+
+
+@pytest.mark.parametrize("subcategory", ["Zoning Variance", "", None, ["Divorce"]])
+def test_unmatched_name_falls_back_to_first_subcategory(family_law_agent, subcategory):
+    result = {"subcategory": subcategory}
+
+    assert family_law_agent._resolve_subcategory(result) == family_law_agent.subcategories[0]
+
+
+def test_agent_without_subcategories_resolves_to_general(family_law_agent):
+    family_law_agent.subcategories = []
+
+    assert family_law_agent._determine_best_subcategory_enhanced("Divorce") == "General"